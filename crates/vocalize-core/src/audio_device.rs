@@ -98,8 +98,13 @@ impl AudioDevice {
 
     /// Create a new mock audio device for Python bindings
     pub fn new_mock_for_bindings() -> Self {
+        Self::new_mock_for_bindings_with_config(AudioConfig::default())
+    }
+
+    /// Create a new mock audio device with custom configuration for Python bindings
+    pub fn new_mock_for_bindings_with_config(config: AudioConfig) -> Self {
         Self {
-            config: AudioConfig::default(),
+            config,
             state: Arc::new(RwLock::new(PlaybackState::Stopped)),
             is_running: Arc::new(AtomicBool::new(false)),
             mock_mode: true,
@@ -333,10 +338,18 @@ impl AudioDevice {
         Some("Mock Audio Device".to_string())
     }
 
-    /// Get audio queue status (mock implementation)
+    /// Fixed playback queue capacity in samples (`buffer_size * channels`)
+    #[must_use]
+    pub fn buffer_capacity(&self) -> usize {
+        self.config.buffer_size as usize * usize::from(self.config.channels)
+    }
+
+    /// Get audio queue status as `(samples queued, samples free)` (mock implementation)
+    ///
+    /// The two values always sum to [`Self::buffer_capacity`].
     #[must_use]
     pub async fn get_queue_status(&self) -> (usize, usize) {
-        (0, 1024) // Mock values: no data in queue, 1024 space available
+        (0, self.buffer_capacity()) // Mock never holds queued data
     }
 }
 
@@ -498,6 +511,7 @@ mod tests {
         let (data, space) = device.get_queue_status().await;
         assert_eq!(data, 0);
         assert_eq!(space, 1024);
+        assert_eq!(data + space, device.buffer_capacity());
     }
 
     #[test]
@@ -180,10 +180,14 @@ impl ModelManager {
         
         // Create ONNX session using 2025 optimization settings and threading configuration
         tracing::info!("Loading model {} from Python-managed cache: {:?}", model_info.name, onnx_file);
+        let intra_threads = std::thread::available_parallelism()
+            .map(|p| p.get())
+            .unwrap_or(4);
         let session = Session::builder()?
             .with_optimization_level(ort::session::builder::GraphOptimizationLevel::Level3)?  // Maximum optimization
-            .with_intra_threads(4)?      // Multi-threaded intra-op execution
-            .with_inter_threads(4)?      // Multi-threaded inter-op execution
+            .with_intra_threads(intra_threads)?  // One intra-op thread per core
+            .with_parallel_execution(true)?  // Run independent graph branches concurrently
+            .with_inter_threads(2)?      // Multi-threaded inter-op execution
             .with_memory_pattern(true)?  // Enable memory pattern optimization
             .commit_from_file(&onnx_file)
             .context(format!("Failed to load ONNX model from {:?}", onnx_file))?;
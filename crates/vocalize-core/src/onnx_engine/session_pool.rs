@@ -31,9 +31,14 @@ impl OnnxSessionPool {
         
         let mut sessions = Vec::with_capacity(pool_size);
         
+        // Split the cores between sessions so concurrent inference doesn't oversubscribe
+        let intra_threads = std::thread::available_parallelism()
+            .map(|p| (p.get() / pool_size).max(1))
+            .unwrap_or(4);
+        
         // Create multiple session instances with optimized settings
         for i in 0..pool_size {
-            let session = Self::create_optimized_session(model_path)
+            let session = Self::create_optimized_session(model_path, intra_threads)
                 .await
                 .with_context(|| format!("Failed to create session {} of {}", i + 1, pool_size))?;
             
@@ -52,7 +57,7 @@ impl OnnxSessionPool {
     }
     
     /// Create an optimized ONNX session with deadlock prevention
-    async fn create_optimized_session(model_path: &std::path::Path) -> Result<Session> {
+    async fn create_optimized_session(model_path: &std::path::Path, intra_threads: usize) -> Result<Session> {
         tracing::debug!("🔧 Creating ONNX session with anti-deadlock configuration");
         
         // Set up session with optimized configuration for better performance
@@ -60,8 +65,10 @@ impl OnnxSessionPool {
             // Use maximum optimization for speed
             .with_optimization_level(GraphOptimizationLevel::Level3)?
             // Multi-threading for better performance
-            .with_intra_threads(4)?
-            .with_inter_threads(4)?
+            .with_intra_threads(intra_threads)?
+            // Inter-op threads only take effect with the parallel executor
+            .with_parallel_execution(true)?
+            .with_inter_threads(2)?
             // Enable memory pattern optimization
             .with_memory_pattern(true)?
             // Load the model
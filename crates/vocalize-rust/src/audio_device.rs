@@ -1,11 +1,13 @@
 //! Python bindings for audio device
 
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 use std::collections::HashMap;
 use std::time::Duration;
 use vocalize_core::{AudioConfig, AudioDevice, AudioDeviceInfo, PlaybackState};
 
 use crate::error::vocalize_error_to_pyerr;
+use crate::Samples;
 
 /// Python wrapper for PlaybackState
 #[pyclass(name = "PlaybackState")]
@@ -28,19 +30,35 @@ impl From<PlaybackState> for PyPlaybackState {
     }
 }
 
-#[pymethods]
 impl PyPlaybackState {
-    fn __str__(&self) -> String {
+    fn name(&self) -> &'static str {
         match self {
-            PyPlaybackState::Stopped => "Stopped".to_string(),
-            PyPlaybackState::Playing => "Playing".to_string(),
-            PyPlaybackState::Paused => "Paused".to_string(),
-            PyPlaybackState::Error => "Error".to_string(),
+            PyPlaybackState::Stopped => "Stopped",
+            PyPlaybackState::Playing => "Playing",
+            PyPlaybackState::Paused => "Paused",
+            PyPlaybackState::Error => "Error",
         }
     }
 
-    fn __repr__(&self) -> String {
-        format!("PlaybackState.{}", self.__str__())
+    fn repr_name(&self) -> &'static str {
+        match self {
+            PyPlaybackState::Stopped => "PlaybackState.Stopped",
+            PyPlaybackState::Playing => "PlaybackState.Playing",
+            PyPlaybackState::Paused => "PlaybackState.Paused",
+            PyPlaybackState::Error => "PlaybackState.Error",
+        }
+    }
+}
+
+#[pymethods]
+impl PyPlaybackState {
+    fn __str__<'py>(&self, py: Python<'py>) -> &'py PyString {
+        // Interned, so repeated calls reuse one Python string
+        PyString::intern(py, self.name())
+    }
+
+    fn __repr__<'py>(&self, py: Python<'py>) -> &'py PyString {
+        PyString::intern(py, self.repr_name())
     }
 
     #[classattr]
@@ -61,11 +79,20 @@ impl PyPlaybackState {
 #[derive(Debug, Clone)]
 pub struct PyAudioDeviceInfo {
     inner: AudioDeviceInfo,
+    // String forms of the non-string fields, formatted once for to_dict()
+    channels_str: String,
+    sample_rates_str: String,
+    is_default_str: String,
 }
 
 impl PyAudioDeviceInfo {
     pub fn new(info: AudioDeviceInfo) -> Self {
-        Self { inner: info }
+        Self {
+            channels_str: info.channels.to_string(),
+            sample_rates_str: format!("{:?}", info.sample_rates),
+            is_default_str: info.is_default.to_string(),
+            inner: info,
+        }
     }
 }
 
@@ -108,12 +135,12 @@ impl PyAudioDeviceInfo {
     }
 
     fn to_dict(&self) -> HashMap<String, String> {
-        let mut dict = HashMap::new();
+        let mut dict = HashMap::with_capacity(5);
         dict.insert("id".to_string(), self.inner.id.clone());
         dict.insert("name".to_string(), self.inner.name.clone());
-        dict.insert("channels".to_string(), self.inner.channels.to_string());
-        dict.insert("sample_rates".to_string(), format!("{:?}", self.inner.sample_rates));
-        dict.insert("is_default".to_string(), self.inner.is_default.to_string());
+        dict.insert("channels".to_string(), self.channels_str.clone());
+        dict.insert("sample_rates".to_string(), self.sample_rates_str.clone());
+        dict.insert("is_default".to_string(), self.is_default_str.clone());
         dict
     }
 }
@@ -236,9 +263,9 @@ impl PyAudioDevice {
     }
 
     #[staticmethod]
-    fn with_config(_config: &PyAudioConfig) -> PyResult<PyAudioDevice> {
-        // Create mock audio device (ignoring config for mock implementation)
-        let device = AudioDevice::new_mock_for_bindings();
+    fn with_config(config: &PyAudioConfig) -> PyResult<PyAudioDevice> {
+        // Create mock audio device with the requested config
+        let device = AudioDevice::new_mock_for_bindings_with_config(config.inner().clone());
         Ok(PyAudioDevice::new(device))
     }
 
@@ -249,7 +276,8 @@ impl PyAudioDevice {
     }
 
     /// Play audio data (simplified sync version for testing)
-    fn play_sync(&self, audio_data: Vec<f32>) -> PyResult<()> {
+    fn play_sync(&self, audio_data: Samples) -> PyResult<()> {
+        let audio_data = audio_data.0;
         if audio_data.is_empty() {
             return Err(crate::error::PyVocalizeError::new(
                 vocalize_core::VocalizeError::invalid_input("Audio data cannot be empty".to_string())
@@ -307,13 +335,13 @@ mod tests {
 
     #[test]
     fn test_py_playback_state_string_repr() {
-        assert_eq!(PyPlaybackState::Stopped.__str__(), "Stopped");
-        assert_eq!(PyPlaybackState::Playing.__str__(), "Playing");
-        assert_eq!(PyPlaybackState::Paused.__str__(), "Paused");
-        assert_eq!(PyPlaybackState::Error.__str__(), "Error");
+        assert_eq!(PyPlaybackState::Stopped.name(), "Stopped");
+        assert_eq!(PyPlaybackState::Playing.name(), "Playing");
+        assert_eq!(PyPlaybackState::Paused.name(), "Paused");
+        assert_eq!(PyPlaybackState::Error.name(), "Error");
         
-        assert_eq!(PyPlaybackState::Stopped.__repr__(), "PlaybackState.Stopped");
-        assert_eq!(PyPlaybackState::Playing.__repr__(), "PlaybackState.Playing");
+        assert_eq!(PyPlaybackState::Stopped.repr_name(), "PlaybackState.Stopped");
+        assert_eq!(PyPlaybackState::Playing.repr_name(), "PlaybackState.Playing");
     }
 
     #[test]
@@ -419,10 +447,10 @@ mod tests {
         
         // Valid audio
         let audio_data = vec![0.1, 0.2, -0.1, -0.2];
-        assert!(device.play_sync(audio_data).is_ok());
+        assert!(device.play_sync(Samples(audio_data)).is_ok());
         
         // Empty audio should fail
-        assert!(device.play_sync(vec![]).is_err());
+        assert!(device.play_sync(Samples(vec![])).is_err());
     }
 
     #[test]
@@ -8,6 +8,7 @@ use std::path::Path;
 use vocalize_core::{AudioFormat, AudioWriter, EncodingSettings};
 
 use crate::error::IntoPyResult;
+use crate::Samples;
 
 /// Python wrapper for AudioFormat
 #[pyclass(name = "AudioFormat")]
@@ -238,11 +239,12 @@ impl PyAudioWriter {
     fn write_file<'py>(
         &self,
         py: Python<'py>,
-        audio_data: Vec<f32>,
+        audio_data: Samples,
         path: String,
         format: PyAudioFormat,
         settings: Option<&PyEncodingSettings>,
     ) -> PyResult<&'py PyAny> {
+        let audio_data = audio_data.0;
         let writer = AudioWriter::new();
         let rust_format = AudioFormat::from(format);
         let rust_settings = settings.map(|s| s.inner().clone());
@@ -260,10 +262,11 @@ impl PyAudioWriter {
     fn write_file_auto<'py>(
         &self,
         py: Python<'py>,
-        audio_data: Vec<f32>,
+        audio_data: Samples,
         path: String,
         settings: Option<&PyEncodingSettings>,
     ) -> PyResult<&'py PyAny> {
+        let audio_data = audio_data.0;
         let writer = AudioWriter::new();
         let rust_settings = settings.map(|s| s.inner().clone());
         
@@ -279,10 +282,11 @@ impl PyAudioWriter {
     /// Estimate file size for given audio data and format
     fn estimate_file_size(
         &self,
-        audio_data: Vec<f32>,
+        audio_data: Samples,
         format: PyAudioFormat,
         settings: &PyEncodingSettings,
     ) -> usize {
+        let audio_data = audio_data.0;
         self.inner.estimate_file_size(
             &audio_data,
             AudioFormat::from(format),
@@ -307,9 +311,10 @@ impl PyAudioWriter {
     /// Validate audio data and settings
     fn validate_inputs(
         &self,
-        audio_data: Vec<f32>,
+        audio_data: Samples,
         _settings: &PyEncodingSettings,
     ) -> PyResult<()> {
+        let audio_data = audio_data.0;
         // Simple validation - check if audio data is not empty
         if audio_data.is_empty() {
             return Err(crate::error::PyVocalizeError::new_err("Audio data cannot be empty".to_string()));
@@ -486,7 +491,7 @@ mod tests {
         let audio_data = vec![0.1, 0.2, -0.1, -0.2];
         let settings = PyEncodingSettings::default();
         
-        let size = writer.estimate_file_size(&audio_data, PyAudioFormat::Wav, &settings);
+        let size = writer.estimate_file_size(Samples(audio_data), PyAudioFormat::Wav, &settings);
         assert!(size > 0);
     }
 
@@ -497,14 +502,14 @@ mod tests {
         
         // Valid audio data
         let valid_audio = vec![0.1, 0.2, -0.1, -0.2];
-        assert!(writer.validate_inputs(&valid_audio, &settings).is_ok());
+        assert!(writer.validate_inputs(Samples(valid_audio), &settings).is_ok());
         
         // Empty audio data
         let empty_audio: Vec<f32> = vec![];
-        assert!(writer.validate_inputs(&empty_audio, &settings).is_err());
+        assert!(writer.validate_inputs(Samples(empty_audio), &settings).is_err());
         
         // Invalid audio samples (NaN)
         let invalid_audio = vec![f32::NAN, 0.5];
-        assert!(writer.validate_inputs(&invalid_audio, &settings).is_err());
+        assert!(writer.validate_inputs(Samples(invalid_audio), &settings).is_err());
     }
 }
\ No newline at end of file
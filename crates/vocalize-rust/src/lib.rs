@@ -3,7 +3,13 @@
 //! This crate provides comprehensive Python bindings for the Vocalize text-to-speech engine
 //! using PyO3. It exposes the full TTS functionality with proper async support.
 
+#[cfg(not(Py_LIMITED_API))]
+use pyo3::buffer::PyBuffer;
+use pyo3::ffi;
 use pyo3::prelude::*;
+#[cfg(Py_LIMITED_API)]
+use pyo3::types::PySlice;
+use std::os::raw::{c_char, c_int};
 
 // Re-export submodules
 mod error;
@@ -27,9 +33,96 @@ pub use audio_writer::PyAudioWriter as AudioWriter;
 pub use audio_device::PyAudioDevice as AudioDevice;
 pub use tts_engine::PyTtsEngine as TtsEngine;
 
+/// CPython's `PyBUF_READ` flag: the memoryview is read-only
+const PYBUF_READ: c_int = 0x100;
+
+/// CPython's `PyBUF_WRITE` flag: the memoryview is writable
+#[cfg(Py_LIMITED_API)]
+const PYBUF_WRITE: c_int = 0x200;
+
+/// Hand samples to Python as an `array.array('f')` rather than a list.
+///
+/// A list boxes every sample as a separate Python float (~28 bytes each); the
+/// array keeps them packed as native f32. The samples are exposed to
+/// `array.frombytes()` through a memoryview over this slice, so they are
+/// copied exactly once. The array still supports len(), indexing and
+/// iteration, and exposes the buffer protocol so numpy can wrap it without
+/// copying.
+pub(crate) fn samples_to_array(py: Python<'_>, samples: &[f32]) -> PyResult<PyObject> {
+    let array = py.import("array")?.getattr("array")?.call1(("f",))?;
+    // SAFETY: the view is released below, before `samples` can go out of scope
+    let view: &PyAny = unsafe {
+        py.from_owned_ptr_or_err(ffi::PyMemoryView_FromMemory(
+            samples.as_ptr() as *mut c_char,
+            std::mem::size_of_val(samples) as ffi::Py_ssize_t,
+            PYBUF_READ,
+        ))?
+    };
+    let filled = array.call_method1("frombytes", (view,));
+    view.call_method0("release")?;
+    filled?;
+    Ok(array.into())
+}
+
+/// Audio samples received from Python.
+///
+/// Anything exposing an f32 buffer - the `array.array('f')` that synthesis
+/// returns, float32 numpy arrays - is copied once, straight into the `Vec`;
+/// any other sequence of floats (e.g. a list) is extracted element by element.
+pub(crate) struct Samples(pub Vec<f32>);
+
+impl<'source> FromPyObject<'source> for Samples {
+    fn extract(ob: &'source PyAny) -> PyResult<Self> {
+        #[cfg(not(Py_LIMITED_API))]
+        if let Ok(buffer) = PyBuffer::<f32>::get(ob) {
+            return Ok(Samples(buffer.to_vec(ob.py())?));
+        }
+        #[cfg(Py_LIMITED_API)]
+        if let Some(samples) = copy_f32_buffer(ob)? {
+            return Ok(Samples(samples));
+        }
+        Ok(Samples(ob.extract()?))
+    }
+}
+
+/// Copy a contiguous f32 buffer into a `Vec` under the limited API.
+///
+/// `PyBuffer` is unavailable to abi3 builds, so the source memoryview is
+/// assigned into a writable memoryview over the destination instead, which
+/// is a single memcpy. Returns `None` for objects without such a buffer.
+#[cfg(Py_LIMITED_API)]
+fn copy_f32_buffer(ob: &PyAny) -> PyResult<Option<Vec<f32>>> {
+    let py = ob.py();
+    let src = match py.import("builtins")?.getattr("memoryview")?.call1((ob,)) {
+        Ok(view) => view,
+        Err(_) => return Ok(None),
+    };
+    if src.getattr("format")?.extract::<&str>()? != "f"
+        || !src.getattr("c_contiguous")?.extract::<bool>()?
+    {
+        return Ok(None);
+    }
+    let nbytes: usize = src.getattr("nbytes")?.extract()?;
+    let mut samples = vec![0.0f32; nbytes / std::mem::size_of::<f32>()];
+    // SAFETY: the view is released below, before `samples` is moved or dropped
+    let dst: &PyAny = unsafe {
+        py.from_owned_ptr_or_err(ffi::PyMemoryView_FromMemory(
+            samples.as_mut_ptr() as *mut c_char,
+            nbytes as ffi::Py_ssize_t,
+            PYBUF_WRITE,
+        ))?
+    };
+    let copied = src
+        .call_method1("cast", ("B",))
+        .and_then(|bytes| dst.set_item(PySlice::new(py, 0, nbytes as isize, 1), bytes));
+    dst.call_method0("release")?;
+    copied?;
+    Ok(Some(samples))
+}
+
 /// 2025 Neural TTS synthesis function - uses Rust TTS engine
 #[pyfunction]
-fn synthesize_neural(text: String, voice_id: Option<String>, speed: Option<f32>, pitch: Option<f32>) -> PyResult<Vec<f32>> {
+fn synthesize_neural(py: Python<'_>, text: String, voice_id: Option<String>, speed: Option<f32>, pitch: Option<f32>) -> PyResult<PyObject> {
     // Rust doesn't handle voice loading - require voice_id from Python
     let voice_id = match voice_id {
         Some(id) => id,
@@ -63,7 +156,7 @@ fn synthesize_neural(text: String, voice_id: Option<String>, speed: Option<f32>,
     let rt = tokio::runtime::Runtime::new()
         .map_err(|e| PyVocalizeError::new_err(format!("Failed to create async runtime: {}", e)))?;
     
-    rt.block_on(async {
+    let samples = rt.block_on(async {
         // Create TTS engine with default config
         let engine = TtsEngine::new().await
             .map_err(|e| PyVocalizeError::new_err(format!("Failed to create TTS engine: {}", e)))?;
@@ -90,18 +183,21 @@ fn synthesize_neural(text: String, voice_id: Option<String>, speed: Option<f32>,
             .map_err(|e| PyVocalizeError::new_err(format!("Synthesis failed: {}", e)))?;
         
         println!("✅ 2025 synthesis completed: {} samples generated", audio_data.len());
-        Ok(audio_data)
-    })
+        Ok::<_, PyErr>(audio_data)
+    })?;
+    
+    samples_to_array(py, &samples)
 }
 
 /// 2025 Neural TTS synthesis using pre-processed tokens (new phoneme pipeline)
 #[pyfunction]
 fn synthesize_from_tokens_neural(
+    py: Python<'_>,
     input_ids: Vec<i64>,
     style_vector: Vec<f32>,
     speed: f32,
     model_id: Option<String>
-) -> PyResult<Vec<f32>> {
+) -> PyResult<PyObject> {
     // Validate inputs
     if input_ids.is_empty() {
         return Err(PyVocalizeError::new_err("Input IDs cannot be empty".to_string()));
@@ -129,7 +225,7 @@ fn synthesize_from_tokens_neural(
     let rt = tokio::runtime::Runtime::new()
         .map_err(|e| PyVocalizeError::new_err(format!("Failed to create async runtime: {}", e)))?;
     
-    rt.block_on(async {
+    let samples = rt.block_on(async {
         // Create ONNX engine with cross-platform cache directory
         let mut engine = OnnxTtsEngine::new_with_default_cache().await
             .map_err(|e| PyVocalizeError::new_err(format!("Failed to create ONNX engine: {}", e)))?;
@@ -152,8 +248,10 @@ fn synthesize_from_tokens_neural(
         .map_err(|e| PyVocalizeError::new_err(format!("Token synthesis failed: {}", e)))?;
         
         println!("✅ 2025 token synthesis completed: {} samples generated", audio_data.len());
-        Ok(audio_data)
-    })
+        Ok::<_, PyErr>(audio_data)
+    })?;
+    
+    samples_to_array(py, &samples)
 }
 
 
@@ -174,7 +272,8 @@ fn list_neural_voices() -> PyResult<Vec<(String, String, String, String)>> {
 
 /// Save neural TTS audio data to a file
 #[pyfunction] 
-fn save_audio_neural(audio_data: Vec<f32>, output_path: String, format: Option<String>) -> PyResult<()> {
+fn save_audio_neural(audio_data: Samples, output_path: String, format: Option<String>) -> PyResult<()> {
+    let audio_data = audio_data.0;
     let format_str = format.unwrap_or_else(|| "wav".to_string());
     let audio_format = match format_str.as_str() {
         "wav" => PyAudioFormat::Wav,
@@ -1,7 +1,9 @@
 //! Python bindings for TTS engine
 
 use pyo3::prelude::*;
+use std::collections::hash_map::DefaultHasher;
 use std::collections::HashMap;
+use std::hash::{Hash, Hasher};
 use vocalize_core::SynthesisParams;
 
 use crate::error::IntoPyResult;
@@ -20,6 +22,17 @@ impl PySynthesisParams {
         Self { inner: params }
     }
 
+    /// Identity used for equality and hashing; floats compare by bit pattern
+    fn key(&self) -> (&str, u32, u32, bool, usize) {
+        (
+            &self.inner.voice.id,
+            self.inner.speed.to_bits(),
+            self.inner.pitch.to_bits(),
+            self.inner.streaming,
+            self.inner.chunk_size,
+        )
+    }
+
     pub fn inner(&self) -> &SynthesisParams {
         &self.inner
     }
@@ -84,6 +97,16 @@ impl PySynthesisParams {
         Self::new(params)
     }
 
+    fn __eq__(&self, other: &Self) -> bool {
+        self.key() == other.key()
+    }
+
+    fn __hash__(&self) -> u64 {
+        let mut hasher = DefaultHasher::new();
+        self.key().hash(&mut hasher);
+        hasher.finish()
+    }
+
     fn __repr__(&self) -> String {
         format!(
             "SynthesisParams(voice='{}', speed={}, pitch={}, streaming={})",
@@ -138,7 +161,7 @@ impl PyTtsEngine {
     }
 
     /// Synthesize text to audio (using real TTS engine)
-    fn synthesize_sync(&self, text: String, params: &PySynthesisParams) -> PyResult<Vec<f32>> {
+    fn synthesize_sync(&self, py: Python<'_>, text: String, params: &PySynthesisParams) -> PyResult<PyObject> {
         // Get the TTS engine (initialize if needed)
         let engine = self.lazy_engine.get_or_init()?;
         
@@ -152,9 +175,11 @@ impl PyTtsEngine {
             format!("Synthesis failed: {}", e)
         ))?;
         
-        audio.map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(
+        let samples = audio.map_err(|e| pyo3::exceptions::PyRuntimeError::new_err(
             format!("Audio synthesis failed: {}", e)
-        ))
+        ))?;
+        
+        crate::samples_to_array(py, &samples)
     }
 
     /// Check if the engine is ready
@@ -304,10 +329,12 @@ mod tests {
         let voice = create_test_voice();
         let params = PySynthesisParams::py_new(voice);
         
-        let result = engine.synthesize_sync("Hello".to_string(), &params);
-        assert!(result.is_ok());
-        
-        let audio = result.unwrap();
-        assert!(!audio.is_empty());
+        Python::with_gil(|py| {
+            let result = engine.synthesize_sync(py, "Hello".to_string(), &params);
+            assert!(result.is_ok());
+            
+            let audio = result.unwrap();
+            assert!(audio.as_ref(py).len().unwrap() > 0);
+        });
     }
 }
\ No newline at end of file
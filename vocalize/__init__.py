@@ -21,7 +21,7 @@ try:
     # Export main classes from Rust bindings
     from vocalize_rust import (
         TtsEngine, SynthesisParams, Voice, VoiceManager, AudioWriter, AudioDevice,
-        VocalizeError, Gender, VoiceStyle
+        VocalizeError, Gender, VoiceStyle, AudioConfig, AudioDeviceInfo, PlaybackState
     )
     
 except ImportError:
@@ -87,6 +87,17 @@ except ImportError:
             new_params.pitch = self.pitch
             new_params.streaming_chunk_size = None
             return new_params
+        
+        def _key(self):
+            return (self.voice.id, self.speed, self.pitch, self.streaming_chunk_size)
+        
+        def __eq__(self, other):
+            if not isinstance(other, SynthesisParams):
+                return NotImplemented
+            return self._key() == other._key()
+        
+        def __hash__(self):
+            return hash(self._key())
     
     class TtsEngine:
         """Mock TtsEngine class."""
@@ -96,14 +107,17 @@ except ImportError:
         def __repr__(self):
             return "TtsEngine()"
         
-        async def synthesize(self, text: str, params: SynthesisParams):
+        def synthesize_sync(self, text: str, params: SynthesisParams):
             # Use CLI components for synthesis
             speed = params.speed or 1.0
             pitch = params.pitch or 0.0
             audio_data = VocalizeComponents.synthesize_text(text, params.voice.id, speed, pitch)
             return audio_data.samples
         
-        async def is_ready(self):
+        async def synthesize(self, text: str, params: SynthesisParams):
+            return self.synthesize_sync(text, params)
+        
+        def is_ready(self):
             return True
     
     class VoiceManager:
@@ -163,4 +177,8 @@ __all__ = [
     "VocalizeError",
     "Gender",
     "VoiceStyle",
-]
\ No newline at end of file
+]
+
+# Device configuration and state types only exist in the Rust bindings
+if _HAS_RUST_BINDINGS:
+    __all__ += ["AudioConfig", "AudioDeviceInfo", "PlaybackState"]
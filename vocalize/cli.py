@@ -16,9 +16,8 @@ import json
 import os
 import sys
 from pathlib import Path
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Sequence, Union
 import time
-import platformdirs
 
 # Check if verbose mode is requested early
 _verbose = "--verbose" in sys.argv
@@ -26,19 +25,33 @@ _verbose = "--verbose" in sys.argv
 # Import our reliable Python model manager
 if _verbose:
     _import_start = time.perf_counter()
-from .model_manager import ModelManager, ensure_model_available
+from .model_manager import ModelManager, default_cache_dir, ensure_model_available
 if _verbose:
     print(f"  ⏱️  Import ModelManager: {time.perf_counter() - _import_start:.3f}s")
 
-try:
-    import sounddevice as sd
-    _HAS_AUDIO = True
-except (ImportError, OSError) as e:
-    _HAS_AUDIO = False
-    if "PortAudio" in str(e):
-        print("Warning: PortAudio not available. Install with: sudo apt-get install portaudio19-dev")
+# Lazy import sounddevice only when playing audio; loading PortAudio slows every CLI start
+_HAS_AUDIO = None
+
+def _import_sounddevice():
+    """Lazy import of sounddevice for faster CLI startup."""
+    global _HAS_AUDIO
+    if _HAS_AUDIO is None:
+        try:
+            import sounddevice as sd
+            _HAS_AUDIO = True
+            return sd
+        except (ImportError, OSError) as e:
+            _HAS_AUDIO = False
+            if "PortAudio" in str(e):
+                print("Warning: PortAudio not available. Install with: sudo apt-get install portaudio19-dev")
+            else:
+                print("Warning: sounddevice not available. Install with: uv add sounddevice")
+            return None
+    elif _HAS_AUDIO:
+        import sounddevice as sd
+        return sd
     else:
-        print("Warning: sounddevice not available. Install with: uv add sounddevice")
+        return None
 
 # Default values (no configuration needed)
 DEFAULT_VOICE = "af_alloy"
@@ -47,6 +60,14 @@ DEFAULT_PITCH = 0.0
 DEFAULT_FORMAT = "wav"
 
 
+def _ensure_printable_stdout():
+    """Keep emoji status messages from crashing non-UTF-8 consoles (e.g. Windows cp1252)."""
+    encoding = (getattr(sys.stdout, "encoding", None) or "").lower()
+    if "utf" not in encoding and hasattr(sys.stdout, "reconfigure"):
+        # Unencodable symbols print as '?' instead of raising UnicodeEncodeError
+        sys.stdout.reconfigure(errors="replace")
+
+
 class Timer:
     """Context manager for timing operations."""
     def __init__(self, name, verbose=False):
@@ -80,7 +101,8 @@ class VocalizeComponents:
             self.style = style
     
     class AudioData:
-        def __init__(self, samples: List[float]):
+        def __init__(self, samples: Sequence[float]):
+            # A list, or the packed array('f') returned by the Rust bindings
             self.samples = samples
     
     @staticmethod
@@ -166,11 +188,12 @@ class VocalizeComponents:
     @staticmethod
     def play_audio(audio_data: 'VocalizeComponents.AudioData'):
         """Real audio playback through computer speakers."""
-        if not _HAS_AUDIO:
+        sd = _import_sounddevice()
+        if not sd:
             print("Error: sounddevice not available. Install with: uv add sounddevice")
             return
         
-        if not audio_data.samples:
+        if len(audio_data.samples) == 0:
             print("Warning: No audio data to play")
             return
         
@@ -197,14 +220,13 @@ def synthesize_with_tokens(text: str, voice: str, speed: float, pitch: float, mo
         
         # Use the phoneme processor to convert text to tokens
         with Timer("Import KokoroPhonemeProcessor", verbose):
-            from .model_manager import KokoroPhonemeProcessor
+            from .model_manager import get_phoneme_processor
         from pathlib import Path
         
         if model == "kokoro":
             # Use cross-platform cache directory that matches Rust implementation
-            cache_base = platformdirs.user_cache_dir("vocalize", "Vocalize")
-            cache_dir = Path(cache_base) / "models" / "models--direct_download" / "local"
-            processor = KokoroPhonemeProcessor(cache_dir)
+            cache_dir = default_cache_dir() / "models--direct_download" / "local"
+            processor = get_phoneme_processor(cache_dir)
             
             # Process text to tokens with proper speed
             result = processor.process_text(text, voice)
@@ -271,7 +293,7 @@ def handle_speak_command(args):
     
     # Ensure model is available
     with Timer("ensure_model_available", verbose):
-        if not ensure_model_available(model):
+        if not ensure_model_available(model, manager=manager):
             print(f"❌ Failed to download model: {model}")
             return
     
@@ -338,7 +360,7 @@ def handle_list_voices_command(args):
     # If no voices found, ensure model is available and try again
     if not voices:
         with Timer("ensure_model_available", verbose):
-            if not ensure_model_available(model):
+            if not ensure_model_available(model, manager=manager):
                 print(f"❌ Failed to download model: {model}")
                 return
         
@@ -462,7 +484,10 @@ def handle_models_command(args):
             sys.exit(1)
         
         model_info = manager.get_model_info(model_id)
-        cached = manager.is_model_cached(model_id)
+        # Resolve each file once and derive the cached status from the same lookups
+        file_paths = {filename: manager.get_model_path(model_id, filename)
+                      for filename in model_info.files}
+        cached = all(path is not None for path in file_paths.values())
         
         print(f"Model: {model_info.name}")
         print(f"ID: {model_id}")
@@ -472,11 +497,9 @@ def handle_models_command(args):
         print(f"Status: {'✅ Cached' if cached else '⬜ Not cached'}")
         
         if cached:
-            for filename in model_info.files:
-                path = manager.get_model_path(model_id, filename)
-                if path:
-                    file_size = path.stat().st_size
-                    print(f"  📄 {filename}: {file_size:,} bytes at {path}")
+            for filename, path in file_paths.items():
+                file_size = os.stat(path).st_size
+                print(f"  📄 {filename}: {file_size:,} bytes at {path}")
     else:
         print(f"Unknown models action: {args.models_action}")
 
@@ -566,6 +589,8 @@ Examples:
 
 def main():
     """Main CLI entry point."""
+    _ensure_printable_stdout()
+    
     # Fast path: Handle help and version without expensive imports
     if len(sys.argv) > 1 and sys.argv[1] in ['--help', '-h', '--version']:
         parser = create_parser()
@@ -6,11 +6,14 @@ huggingface_hub client, eliminating the unreliable Rust hf-hub hanging issues.
 """
 
 import os
+import sys
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
-import platformdirs
+from functools import lru_cache
 
 # Configure HuggingFace Hub for cross-platform compatibility
 os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "true"
@@ -57,12 +60,75 @@ def _import_requests():
         return None
 
 
+# Stream downloads in 1 MiB chunks: 8 KiB chunks cost one Python iteration and
+# write() call per 8 KiB, which adds up to tens of thousands for a 300 MB model
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Files at least this large are fetched as parallel HTTP range requests when the
+# server supports them; a single TCP stream rarely saturates a fast link
+PARALLEL_DOWNLOAD_MIN_SIZE = 16 * 1024 * 1024
+PARALLEL_DOWNLOAD_WORKERS = 8
+
+# (connect, read) timeouts for download requests, in seconds
+DOWNLOAD_TIMEOUT = (5, 30)
+
+# Tokenized texts remembered per phoneme processor; TTS input is dominated by
+# a small set of repeated words and phrases, so a modest LRU hits often
+TOKEN_CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=1)
+def default_cache_dir() -> Path:
+    """Get the default model cache directory, resolved once per process."""
+    # Cross-platform cache directory that matches the Rust implementation:
+    # Windows: C:\Users\{user}\AppData\Local\Vocalize\vocalize\cache\models
+    # macOS: /Users/{user}/Library/Caches/ai.Vocalize.vocalize/models
+    # Linux: /home/{user}/.cache/vocalize/models
+    import platformdirs
+    return Path(platformdirs.user_cache_dir("vocalize", "Vocalize")) / "models"
+
+
 def _import_shutil():
     """Lazy import of shutil for faster CLI startup."""
     import shutil
     return shutil
 
 
+class _DownloadProgress:
+    """Thread-safe download progress reporter that redraws in place only on a TTY."""
+    
+    def __init__(self, total_size: int):
+        self.total_size = total_size
+        self.downloaded = 0
+        self._isatty = sys.stdout.isatty()
+        self._last_step = -1
+        self._lock = threading.Lock()
+    
+    def update(self, nbytes: int) -> None:
+        """Record downloaded bytes, printing only when the shown percentage changes."""
+        with self._lock:
+            self.downloaded += nbytes
+            if not self.total_size:
+                return
+            progress = self.downloaded * 100 / self.total_size
+            # Redraw every 1% on a terminal; in logs, emit one line per 10%
+            step = int(progress) if self._isatty else int(progress // 10)
+            if step == self._last_step:
+                return
+            self._last_step = step
+            if self._isatty:
+                sys.stdout.write(f"\r  ⏳ Progress: {progress:5.1f}%")
+                sys.stdout.flush()
+            else:
+                print(f"  ⏳ Progress: {step * 10}%")
+    
+    def finish(self) -> None:
+        """Terminate the in-place progress line."""
+        if self._isatty and self._last_step >= 0:
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+
+
 @dataclass
 class ModelInfo:
     """Information about a neural TTS model."""
@@ -100,12 +166,7 @@ class ModelManager:
             self.cache_dir = Path(cache_dir)
         else:
             # Use cross-platform cache directory that matches Rust implementation
-            # This creates paths like:
-            # Windows: C:\Users\{user}\AppData\Local\Vocalize\vocalize\cache\models
-            # macOS: /Users/{user}/Library/Caches/ai.Vocalize.vocalize/models  
-            # Linux: /home/{user}/.cache/vocalize/models
-            cache_base = platformdirs.user_cache_dir("vocalize", "Vocalize")
-            self.cache_dir = Path(cache_base) / "models"
+            self.cache_dir = default_cache_dir()
         
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         
@@ -126,14 +187,15 @@ class ModelManager:
             # Check in local directory first (no symlinks)
             model_local_dir = self.cache_dir / f"models--{model_info.repo_id.replace('/', '--')}" / "local"
         
-        # Check if all required files exist in local directory
-        if model_local_dir.exists():
-            all_files_exist = all(
-                (model_local_dir / filename).exists() and (model_local_dir / filename).is_file()
-                for filename in model_info.files
-            )
-            if all_files_exist:
-                return True
+        # Check if all required files exist in local directory with a single
+        # directory listing instead of two stat calls per file
+        try:
+            present = set(os.listdir(model_local_dir))
+        except (FileNotFoundError, NotADirectoryError):
+            present = set()
+        all_files_exist = set(model_info.files).issubset(present)
+        if all_files_exist:
+            return True
         
         # Fallback: check in snapshots directory (legacy symlink structure)
         model_cache_dir = self.cache_dir / f"models--{model_info.repo_id.replace('/', '--')}"
@@ -145,8 +207,8 @@ class ModelManager:
         return False
     
     def get_model_path(self, model_id: str, filename: str) -> Optional[Path]:
-        """Get the local path to a cached model file."""
-        if not self.is_model_cached(model_id):
+        """Get the local path to a cached model file, or None if it is not cached."""
+        if model_id not in self.MODELS:
             return None
             
         model_info = self.MODELS[model_id]
@@ -157,9 +219,9 @@ class ModelManager:
         else:
             # Check in local directory first (no symlinks)
             model_local_dir = self.cache_dir / f"models--{model_info.repo_id.replace('/', '--')}" / "local"
-        local_file_path = model_local_dir / filename
-        if local_file_path.exists() and local_file_path.is_file():
-            return local_file_path
+        local_file_path = os.path.join(model_local_dir, filename)
+        if os.path.isfile(local_file_path):
+            return Path(local_file_path)
         
         # Fallback: check in snapshots directory (legacy symlink structure)
         model_cache_dir = self.cache_dir / f"models--{model_info.repo_id.replace('/', '--')}"
@@ -249,33 +311,150 @@ class ModelManager:
         model_local_dir = self.cache_dir / "models--direct_download" / "local"
         model_local_dir.mkdir(parents=True, exist_ok=True)
         
-        for filename, url in model_urls.items():
-            local_file = model_local_dir / filename
-            
-            # Skip if exists and not forcing
-            if local_file.exists() and not force:
-                print(f"  ✓ {filename} already exists")
-                continue
-            
-            print(f"  📄 Downloading {filename} from GitHub releases...")
-            
-            try:
-                response = requests.get(url, stream=True)
-                response.raise_for_status()
+        with self._create_download_session(requests) as session:
+            for filename, url in model_urls.items():
+                local_file = model_local_dir / filename
                 
-                with open(local_file, 'wb') as f:
-                    for chunk in response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+                # Skip if exists and not forcing
+                if local_file.exists() and not force:
+                    print(f"  ✓ {filename} already exists")
+                    continue
                 
-                print(f"  ✓ Downloaded {filename} ({local_file.stat().st_size // (1024*1024)}MB)")
+                print(f"  📄 Downloading {filename} from GitHub releases...")
                 
-            except Exception as e:
-                print(f"  ❌ Failed to download {filename}: {e}")
-                return False
+                try:
+                    file_size = self._download_file(session, url, local_file)
+                    
+                    print(f"  ✓ Downloaded {filename} ({file_size // (1024*1024)}MB)")
+                    
+                except Exception as e:
+                    print(f"  ❌ Failed to download {filename}: {e}")
+                    return False
         
         print("✅ Successfully downloaded 2025 Kokoro model files")
         return True
     
+    def _create_download_session(self, requests):
+        """Create a pooled HTTP session with retries, shared by all downloads and range workers."""
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=PARALLEL_DOWNLOAD_WORKERS,
+            pool_maxsize=PARALLEL_DOWNLOAD_WORKERS,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        # Model files are already compressed; identity encoding keeps Content-Length accurate
+        session.headers["Accept-Encoding"] = "identity"
+        return session
+    
+    def _download_file(self, session, url: str, local_file: Path) -> int:
+        """
+        Download a URL to a local file, splitting it into parallel range requests when possible.
+        
+        Returns:
+            Size of the downloaded file in bytes
+        
+        Raises:
+            ValueError: If the downloaded file is truncated
+        """
+        try:
+            head = session.head(url, allow_redirects=True, timeout=DOWNLOAD_TIMEOUT)
+            head.raise_for_status()
+        except OSError:
+            # Some mirrors and proxies reject or mangle HEAD (405 etc.); the
+            # size and range support are only needed for the parallel path
+            head = None
+        total_size = int(head.headers.get("content-length", 0)) if head is not None else 0
+        
+        # Write to a side file and rename on success, so a crash or failed check
+        # never leaves a partial file at the path is_model_cached looks for
+        part_file = local_file.with_name(local_file.name + ".part")
+        progress = _DownloadProgress(total_size)
+        try:
+            if (head is not None and head.headers.get("accept-ranges") == "bytes"
+                    and total_size >= PARALLEL_DOWNLOAD_MIN_SIZE):
+                # Use the post-redirect URL so every range request skips the redirect hop
+                downloaded = self._download_ranges(session, head.url, part_file, total_size, progress)
+            else:
+                downloaded = False
+            
+            if not downloaded:
+                # Single-stream fallback
+                response = session.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT)
+                response.raise_for_status()
+                total_size = total_size or int(response.headers.get("content-length", 0))
+                # Close out any line a refused range attempt started before restarting
+                progress.finish()
+                progress = _DownloadProgress(total_size)
+                
+                written = 0
+                with open(part_file, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        written += f.write(chunk)
+                        progress.update(len(chunk))
+                
+                if total_size and written != total_size:
+                    raise ValueError(f"Download truncated: got {written} of {total_size} bytes")
+                total_size = written
+            
+            os.replace(part_file, local_file)
+            return total_size
+        finally:
+            progress.finish()
+            if part_file.exists():
+                part_file.unlink()
+    
+    def _download_ranges(self, session, url: str, local_file: Path, total_size: int,
+                         progress: _DownloadProgress) -> bool:
+        """
+        Download a file as parallel byte ranges written at their final offsets.
+        
+        Returns:
+            True if every range was served, False if the server ignored the Range header
+        """
+        from concurrent.futures import ThreadPoolExecutor
+        
+        part_size = -(-total_size // PARALLEL_DOWNLOAD_WORKERS)
+        ranges = [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ]
+        
+        # Preallocate so each worker can write its range in place
+        with open(local_file, 'wb') as f:
+            try:
+                # Reserve real blocks up front instead of a sparse file where supported
+                os.posix_fallocate(f.fileno(), 0, total_size)
+            except (AttributeError, OSError):
+                f.truncate(total_size)
+        
+        def fetch_range(start: int, end: int) -> bool:
+            response = session.get(url, headers={"Range": f"bytes={start}-{end}"},
+                                   stream=True, timeout=DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+            if response.status_code != 206:
+                response.close()
+                return False
+            
+            written = 0
+            with open(local_file, 'r+b') as f:
+                f.seek(start)
+                for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                    written += f.write(chunk)
+                    progress.update(len(chunk))
+            
+            if written != end - start + 1:
+                raise ValueError(f"Download truncated: range {start}-{end} returned {written} bytes")
+            return True
+        
+        with ThreadPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [pool.submit(fetch_range, start, end) for start, end in ranges]
+            return all([future.result() for future in futures])
+    
     def list_available_models(self) -> List[str]:
         """List all available models."""
         return list(self.MODELS.keys())
@@ -329,9 +508,19 @@ class ModelManager:
             return "0 B"
             
         total_size = 0
-        for file_path in self.cache_dir.rglob("*"):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
+        # Walk with os.scandir: DirEntry carries the file type (and on Windows the
+        # size) from the directory listing, avoiding rglob's Path objects and extra stats
+        pending = [str(self.cache_dir)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.is_file():
+                            total_size += entry.stat().st_size
+            except (FileNotFoundError, NotADirectoryError):
+                continue
         
         # Convert to human readable
         for unit in ['B', 'KB', 'MB', 'GB']:
@@ -446,7 +635,8 @@ class ModelManager:
         return voice_files
 
 
-def ensure_model_available(model_id: str, cache_dir: Optional[str] = None) -> bool:
+def ensure_model_available(model_id: str, cache_dir: Optional[str] = None,
+                           manager: Optional[ModelManager] = None) -> bool:
     """
     Ensure a model is available for use, downloading if necessary.
     
@@ -455,11 +645,13 @@ def ensure_model_available(model_id: str, cache_dir: Optional[str] = None) -> bo
     Args:
         model_id: Model to ensure is available
         cache_dir: Optional cache directory override
+        manager: Existing ModelManager to reuse instead of constructing a new one
         
     Returns:
         True if model is available, False otherwise
     """
-    manager = ModelManager(cache_dir)
+    if manager is None:
+        manager = ModelManager(cache_dir)
     
     # Check if already cached
     if manager.is_model_cached(model_id):
@@ -478,26 +670,34 @@ class KokoroPhonemeProcessor:
         self.tokenizer = None
         self.phoneme_config = None
         self.voices = None
+        self.voice_files = frozenset()
+        # text -> input_ids tuple, least recently used first
+        self._token_cache = OrderedDict()
+        # The CLI and engine may tokenize from worker threads
+        self._token_lock = threading.Lock()
         self._load_phoneme_config()
         self._load_voices()
         
     def _load_phoneme_config(self):
         """Load phoneme-to-token mapping configuration."""
         config_file = self.model_dir / "phoneme_config.json"
-        if config_file.exists():
-            import json
-            with open(config_file, 'r') as f:
-                self.phoneme_config = json.load(f)
-                print("✅ Loaded phoneme configuration")
+        try:
+            # Read raw bytes; json detects and decodes UTF-8 itself, skipping the text layer
+            with open(config_file, 'rb') as f:
+                self.phoneme_config = json.loads(f.read())
+        except FileNotFoundError:
+            return
+        print("✅ Loaded phoneme configuration")
     
     def _load_voices(self):
         """Load voice embeddings from NPZ file."""
         voices_file = self.model_dir / "voices-v1.0.bin"
         if voices_file.exists():
             try:
-                # NPZ loading requires full numpy, not tinynumpy
                 import numpy as np
                 self.voices = np.load(str(voices_file))
+                # Hashed membership for voice lookups instead of scanning the NPZ file list
+                self.voice_files = frozenset(self.voices.files)
                 print(f"✅ Loaded {len(self.voices.files)} voices from NPZ file")
                 # List available voices
                 print(f"   Available voices: {', '.join(sorted(self.voices.files)[:10])}...")
@@ -527,38 +727,7 @@ class KokoroPhonemeProcessor:
         Returns:
             dict with 'input_ids', 'style', 'speed' for ONNX model
         """
-        # For testing: create mock tokenization until ttstokenizer is properly installed
-        if not self.tokenizer:
-            if not self.setup_tokenizer():
-                print("⚠️  Using mock tokenization for testing (ttstokenizer not available)")
-                # Mock tokenization: convert text to character-based tokens
-                char_tokens = [ord(c) % 256 for c in text.lower()]  # Simple char-to-token mapping
-                input_ids = [0] + char_tokens[:510] + [0]  # Add padding, ensure max 512
-                
-                # Load real voice embedding or fall back to random
-                style_vector = self._get_voice_embedding(voice_id)
-                
-                return {
-                    "input_ids": input_ids,
-                    "style": style_vector,  # Already a list
-                    "speed": 1.0,
-                    "voice_id": voice_id
-                }
-        
-        # Real tokenization with ttstokenizer
-        tokens = self.tokenizer(text)
-        # ttstokenizer returns numpy array of token IDs
-        if hasattr(tokens, 'tolist'):
-            # Convert numpy array to list and add padding
-            token_list = tokens.tolist()[:510]  # Limit length
-            input_ids = [0] + token_list + [0]  # Add padding tokens
-        else:
-            # Fallback if unexpected format
-            input_ids = [0] + list(tokens)[:510] + [0]
-        
-        # Ensure max length constraint
-        if len(input_ids) > 512:
-            input_ids = input_ids[:512]
+        input_ids = self._tokenize(text)
         
         # Load real voice embedding from NPZ file
         style_vector = self._get_voice_embedding(voice_id)
@@ -570,6 +739,51 @@ class KokoroPhonemeProcessor:
             "voice_id": voice_id
         }
     
+    def _tokenize(self, text: str) -> list:
+        """Tokenize text into padded input_ids, memoized in a bounded LRU."""
+        with self._token_lock:
+            cached = self._token_cache.get(text)
+            if cached is not None:
+                self._token_cache.move_to_end(text)
+                return list(cached)
+        
+        # For testing: create mock tokenization until ttstokenizer is properly installed
+        if not self.tokenizer and not self.setup_tokenizer():
+            print("⚠️  Using mock tokenization for testing (ttstokenizer not available)")
+            # Mock tokenization: convert text to character-based tokens
+            char_tokens = [ord(c) % 256 for c in text.lower()]  # Simple char-to-token mapping
+            # Not cached, so real tokens are used as soon as ttstokenizer appears
+            return [0] + char_tokens[:510] + [0]  # Add padding, ensure max 512
+        else:
+            # Real tokenization with ttstokenizer
+            tokens = self.tokenizer(text)
+            # ttstokenizer returns numpy array of token IDs
+            if hasattr(tokens, 'tolist'):
+                # Convert numpy array to list and add padding
+                token_list = tokens.tolist()[:510]  # Limit length
+                input_ids = [0] + token_list + [0]  # Add padding tokens
+            else:
+                # Fallback if unexpected format
+                input_ids = [0] + list(tokens)[:510] + [0]
+            
+            # Ensure max length constraint
+            if len(input_ids) > 512:
+                input_ids = input_ids[:512]
+        
+        # Store an immutable copy so callers can't alter cached tokens
+        with self._token_lock:
+            self._token_cache[text] = tuple(input_ids)
+            if len(self._token_cache) > TOKEN_CACHE_SIZE:
+                self._token_cache.popitem(last=False)
+        return input_ids
+    
+    def _load_style_vector(self, voice_name: str, label: str) -> list:
+        """Extract the first frame's 256-dim style vector for a voice present in the NPZ file."""
+        # Voice arrays have shape 510x1x256
+        style = self.voices[voice_name][0, 0, :]
+        print(f"✅ Loaded {label} '{voice_name}' (range: [{style.min():.3f}, {style.max():.3f}])")
+        return style.tolist()
+    
     def _get_voice_embedding(self, voice_id: str) -> list:
         """Get voice embedding from loaded NPZ file with safe fallback."""
         # Import voice alias resolution
@@ -579,20 +793,12 @@ class KokoroPhonemeProcessor:
         resolved_voice_id = VOICE_ALIASES.get(voice_id.lower(), voice_id)
         
         # Try exact match first
-        if self.voices is not None and resolved_voice_id in self.voices.files:
-            # Get the voice array (shape: 510x1x256)
-            voice_array = self.voices[resolved_voice_id]
-            # Extract the first frame's style vector (256 dimensions)
-            style_vector = voice_array[0, 0, :].tolist()
-            print(f"✅ Loaded voice embedding for '{resolved_voice_id}' (range: [{min(style_vector):.3f}, {max(style_vector):.3f}])")
-            return style_vector
+        if resolved_voice_id in self.voice_files:
+            return self._load_style_vector(resolved_voice_id, "voice embedding for")
         
         # Try original voice_id if alias didn't work
-        if self.voices is not None and voice_id in self.voices.files:
-            voice_array = self.voices[voice_id]
-            style_vector = voice_array[0, 0, :].tolist()
-            print(f"✅ Loaded voice embedding for '{voice_id}' (range: [{min(style_vector):.3f}, {max(style_vector):.3f}])")
-            return style_vector
+        if voice_id in self.voice_files:
+            return self._load_style_vector(voice_id, "voice embedding for")
         
         # Voice not found - show warning and use default
         print(f"⚠️  Voice '{voice_id}' not found, using default 'af_alloy'")
@@ -600,11 +806,8 @@ class KokoroPhonemeProcessor:
         # SAFE FALLBACK: Use default voice instead of random values
         default_voices = ["af_alloy", "af_bella", "af_sarah"]  # Known good voices
         for default_voice in default_voices:
-            if self.voices is not None and default_voice in self.voices.files:
-                voice_array = self.voices[default_voice]
-                style_vector = voice_array[0, 0, :].tolist()
-                print(f"✅ Loaded fallback voice embedding '{default_voice}' (range: [{min(style_vector):.3f}, {max(style_vector):.3f}])")
-                return style_vector
+            if default_voice in self.voice_files:
+                return self._load_style_vector(default_voice, "fallback voice embedding")
         
         # Final emergency fallback: Create safe neutral vector
         print(f"❌ No voices available in NPZ file, using neutral embedding")
@@ -614,6 +817,17 @@ class KokoroPhonemeProcessor:
         return [random.gauss(0, 0.1) for _ in range(256)]  # Small gaussian noise around 0
 
 
+@lru_cache(maxsize=None)
+def get_phoneme_processor(model_dir: Path) -> KokoroPhonemeProcessor:
+    """Get the shared phoneme processor for a model directory.
+
+    Building one loads the phoneme config and voice embeddings from disk, so
+    processors are created once per directory and reused, which also keeps
+    their tokenization cache warm across calls.
+    """
+    return KokoroPhonemeProcessor(model_dir)
+
+
 if __name__ == "__main__":
     # Simple CLI for testing
     import sys
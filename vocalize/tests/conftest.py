@@ -0,0 +1,141 @@
+"""Shared fixtures for the vocalize test suite."""
+
+import os
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+import vocalize
+from vocalize import (
+    AudioDevice, Gender, SynthesisParams, TtsEngine, Voice, VoiceManager,
+)
+
+# Synthesized audio keyed by text, shared across the whole session
+_SYN_CACHE = {}
+
+# Canned output for the mocked backends
+_MOCK_AUDIO = [0.0] * 512
+_MOCK_WAV = b"RIFF" + b"\x00" * 40
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow", action="store_true", default=False,
+        help="run tests marked as slow (or set RUN_SLOW=1)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-slow") or os.environ.get("RUN_SLOW"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def available_devices():
+    """Enumerate host audio devices once per test session."""
+    return AudioDevice.get_available_devices()
+
+
+@pytest.fixture(scope="module")
+def audio_device():
+    """Open one audio device per test module instead of one per test.
+
+    ``play_sync`` returns once playback is done, so every test leaves the
+    device stopped and the next one can reuse it as is.
+    """
+    return AudioDevice()
+
+
+@pytest.fixture(scope="module")
+def audio_device2():
+    """Second module-scoped device for tests that need two at once."""
+    return AudioDevice()
+
+
+@pytest.fixture(scope="session")
+def tts():
+    """Load the TTS engine once per session as ``(engine, voice, params)``.
+
+    ``voice`` and ``params`` are immutable, so every test shares the same
+    instances rather than rebuilding them across the FFI boundary.
+    """
+    engine = TtsEngine()
+    voice = Voice.default()
+    return engine, voice, SynthesisParams(voice)
+
+
+@pytest.fixture
+def synth(tts):
+    """Synthesize text with the shared engine, memoizing the audio by text."""
+    engine, _, params = tts
+
+    def _synth(text):
+        if text not in _SYN_CACHE:
+            _SYN_CACHE[text] = engine.synthesize_sync(text, params)
+        # Hand out a copy so playback can't mutate the cached samples
+        return list(_SYN_CACHE[text])
+
+    return _synth
+
+
+@pytest.fixture(scope="session")
+def tts_engine(tts):
+    """The session-wide TTS engine."""
+    return tts[0]
+
+
+@pytest.fixture(scope="session")
+def voice(tts):
+    """The session-wide default voice."""
+    return tts[1]
+
+
+@pytest.fixture(scope="session")
+def params(tts):
+    """Synthesis parameters for the session-wide default voice."""
+    return tts[2]
+
+
+@pytest.fixture(scope="session")
+def voices_by_gender():
+    """Enumerate the available voices once per session, keyed by gender.
+
+    Voices are immutable, so tests can share the lists; derive new voices
+    with ``with_speed``/``with_pitch`` rather than mutating these.
+    """
+    manager = VoiceManager()
+    return {
+        gender: manager.get_voices_by_gender(gender)
+        for gender in (Gender.MALE, Gender.FEMALE)
+    }
+
+
+@pytest.fixture
+def mock_rust_backend(monkeypatch):
+    """Stand-in for the ``vocalize_rust`` bindings the CLI components call.
+
+    Synthesis returns canned audio and saving writes a tiny stub file, so
+    ``VocalizeComponents`` runs end to end without a model or encoder. The
+    model check is patched to succeed without touching the network.
+    """
+    backend = Mock(spec=["synthesize_neural", "save_audio_neural"])
+    backend.synthesize_neural.side_effect = lambda *_: list(_MOCK_AUDIO)
+    backend.save_audio_neural.side_effect = (
+        lambda samples, path, fmt: Path(path).write_bytes(_MOCK_WAV)
+    )
+    monkeypatch.setattr(vocalize, "vocalize_rust", backend, raising=False)
+    monkeypatch.setattr("vocalize.cli.ensure_model_available", lambda *_, **__: True)
+    return backend
+
+
+@pytest.fixture
+def mock_sounddevice(monkeypatch):
+    """Stand-in for ``sounddevice`` so playback never touches the sound card."""
+    sd = Mock(spec=["play", "wait"])
+    monkeypatch.setattr("vocalize.cli._import_sounddevice", lambda: sd)
+    return sd
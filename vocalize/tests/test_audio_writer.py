@@ -2,8 +2,6 @@
 
 import pytest
 import asyncio
-import tempfile
-import os
 from pathlib import Path
 from typing import List
 
@@ -11,12 +9,22 @@ from vocalize import (
     AudioWriter,
     AudioFormat,
     EncodingSettings,
-    TtsEngine,
     SynthesisParams,
-    Voice,
     VocalizeError,
 )
 
+# Shared test signals; tuples so no test can mutate another's input
+_AUDIO_SHORT = (0.1, 0.2, -0.1, -0.2) * 100   # 400 samples
+_AUDIO_LONG = (0.1, 0.2, -0.1, -0.2) * 1000   # 4000 samples
+
+# (format, extension, MIME type, is_lossy)
+FORMAT_TABLE = [
+    (AudioFormat.WAV, "wav", "audio/wav", False),
+    (AudioFormat.MP3, "mp3", "audio/mpeg", True),
+    (AudioFormat.FLAC, "flac", "audio/flac", False),
+    (AudioFormat.OGG, "ogg", "audio/ogg", True),
+]
+
 
 class TestAudioFormat:
     """Test AudioFormat enum."""
@@ -28,45 +36,25 @@ class TestAudioFormat:
         assert hasattr(AudioFormat, 'FLAC')
         assert hasattr(AudioFormat, 'OGG')
         
-    def test_audio_format_properties(self):
-        """Test AudioFormat properties."""
-        assert AudioFormat.WAV.extension() == "wav"
-        assert AudioFormat.MP3.extension() == "mp3"
-        assert AudioFormat.FLAC.extension() == "flac"
-        assert AudioFormat.OGG.extension() == "ogg"
-        
-        assert AudioFormat.WAV.mime_type() == "audio/wav"
-        assert AudioFormat.MP3.mime_type() == "audio/mpeg"
-        assert AudioFormat.FLAC.mime_type() == "audio/flac"
-        assert AudioFormat.OGG.mime_type() == "audio/ogg"
-        
-    def test_audio_format_lossy(self):
-        """Test AudioFormat lossy property."""
-        assert not AudioFormat.WAV.is_lossy()
-        assert AudioFormat.MP3.is_lossy()
-        assert not AudioFormat.FLAC.is_lossy()
-        assert AudioFormat.OGG.is_lossy()
-        
-    def test_audio_format_description(self):
-        """Test AudioFormat description."""
-        descriptions = [
-            AudioFormat.WAV.description(),
-            AudioFormat.MP3.description(),
-            AudioFormat.FLAC.description(),
-            AudioFormat.OGG.description(),
-        ]
+    @pytest.mark.parametrize("fmt,ext,mime,lossy", FORMAT_TABLE)
+    def test_audio_format_properties(self, fmt, ext, mime, lossy):
+        """Test AudioFormat extension, MIME type, lossiness and description."""
+        assert fmt.extension() == ext
+        assert fmt.mime_type() == mime
+        assert fmt.is_lossy() == lossy
         
-        for desc in descriptions:
-            assert isinstance(desc, str)
-            assert len(desc) > 0
-            
-    def test_audio_format_from_extension(self):
+        desc = fmt.description()
+        assert isinstance(desc, str)
+        assert len(desc) > 0
+        
+    @pytest.mark.parametrize("fmt,ext,mime,lossy", FORMAT_TABLE)
+    def test_audio_format_from_extension(self, fmt, ext, mime, lossy):
         """Test AudioFormat from extension."""
-        assert AudioFormat.from_extension("wav") == AudioFormat.WAV
-        assert AudioFormat.from_extension("mp3") == AudioFormat.MP3
-        assert AudioFormat.from_extension("WAV") == AudioFormat.WAV  # Case insensitive
-        assert AudioFormat.from_extension("MP3") == AudioFormat.MP3
+        assert AudioFormat.from_extension(ext) == fmt
+        assert AudioFormat.from_extension(ext.upper()) == fmt  # Case insensitive
         
+    def test_audio_format_from_unknown_extension(self):
+        """Test AudioFormat from an unknown extension."""
         with pytest.raises(VocalizeError):
             AudioFormat.from_extension("xyz")
             
@@ -256,7 +244,7 @@ class TestAudioWriter:
     def test_audio_writer_estimate_file_size(self):
         """Test audio writer file size estimation."""
         writer = AudioWriter()
-        audio_data = [0.1, 0.2, -0.1, -0.2] * 1000  # 4000 samples
+        audio_data = _AUDIO_LONG
         settings = EncodingSettings.default()
         
         # Test different formats
@@ -274,143 +262,108 @@ class TestAudioWriterFileOperations:
     """Test AudioWriter file operations."""
     
     @pytest.mark.asyncio
-    async def test_write_wav_file(self):
+    async def test_write_wav_file(self, tmp_path):
         """Test writing WAV file."""
         writer = AudioWriter()
-        audio_data = [0.1, 0.2, -0.1, -0.2] * 100
+        audio_data = _AUDIO_SHORT
         settings = EncodingSettings.default()
+        path = tmp_path / "out.wav"
         
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            try:
-                await writer.write_file(audio_data, tmp.name, AudioFormat.WAV, settings)
-                
-                # Check file was created and has content
-                assert os.path.exists(tmp.name)
-                assert os.path.getsize(tmp.name) > 0
-            finally:
-                os.unlink(tmp.name)
+        await writer.write_file(audio_data, str(path), AudioFormat.WAV, settings)
+        
+        # Check file was created and has content
+        assert path.stat().st_size > 0
                 
     @pytest.mark.asyncio
-    async def test_write_file_auto_detection(self):
+    async def test_write_file_auto_detection(self, tmp_path):
         """Test writing file with auto format detection."""
         writer = AudioWriter()
-        audio_data = [0.1, 0.2, -0.1, -0.2] * 100
+        audio_data = _AUDIO_SHORT
         settings = EncodingSettings.default()
+        path = tmp_path / "out.wav"
         
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            try:
-                await writer.write_file_auto(audio_data, tmp.name, settings)
-                
-                # Check file was created and has content
-                assert os.path.exists(tmp.name)
-                assert os.path.getsize(tmp.name) > 0
-            finally:
-                os.unlink(tmp.name)
+        await writer.write_file_auto(audio_data, str(path), settings)
+        
+        # Check file was created and has content
+        assert path.stat().st_size > 0
                 
     @pytest.mark.asyncio
-    async def test_write_unsupported_format(self):
+    async def test_write_unsupported_format(self, tmp_path):
         """Test writing unsupported format."""
         writer = AudioWriter()
-        audio_data = [0.1, 0.2, -0.1, -0.2] * 100
+        audio_data = _AUDIO_SHORT
         settings = EncodingSettings.default()
         
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
-            try:
-                # MP3 is not implemented yet, should fail
-                with pytest.raises(VocalizeError):
-                    await writer.write_file(audio_data, tmp.name, AudioFormat.MP3, settings)
-            finally:
-                if os.path.exists(tmp.name):
-                    os.unlink(tmp.name)
+        # MP3 is not implemented yet, should fail
+        with pytest.raises(VocalizeError):
+            await writer.write_file(audio_data, str(tmp_path / "out.mp3"), AudioFormat.MP3, settings)
                     
     @pytest.mark.asyncio
-    async def test_write_different_bit_depths(self):
+    @pytest.mark.parametrize("bit_depth", [8, 16, 24, 32])
+    async def test_write_different_bit_depths(self, tmp_path, bit_depth):
         """Test writing WAV files with different bit depths."""
         writer = AudioWriter()
-        audio_data = [0.1, 0.2, -0.1, -0.2] * 100
+        audio_data = _AUDIO_SHORT
+        settings = EncodingSettings.default().with_bit_depth(bit_depth)
+        path = tmp_path / "out.wav"
         
-        for bit_depth in [8, 16, 24, 32]:
-            settings = EncodingSettings.default().with_bit_depth(bit_depth)
-            
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                try:
-                    await writer.write_file(audio_data, tmp.name, AudioFormat.WAV, settings)
-                    
-                    # Check file was created
-                    assert os.path.exists(tmp.name)
-                    assert os.path.getsize(tmp.name) > 0
-                finally:
-                    os.unlink(tmp.name)
+        await writer.write_file(audio_data, str(path), AudioFormat.WAV, settings)
+        
+        # Check file was created
+        assert path.stat().st_size > 0
                     
     @pytest.mark.asyncio
-    async def test_write_different_sample_rates(self):
+    @pytest.mark.parametrize("sample_rate", [22050, 44100, 48000])
+    async def test_write_different_sample_rates(self, tmp_path, sample_rate):
         """Test writing WAV files with different sample rates."""
         writer = AudioWriter()
-        audio_data = [0.1, 0.2, -0.1, -0.2] * 100
+        audio_data = _AUDIO_SHORT
+        settings = EncodingSettings(sample_rate, 1)
+        path = tmp_path / "out.wav"
         
-        for sample_rate in [22050, 44100, 48000]:
-            settings = EncodingSettings(sample_rate, 1)
-            
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                try:
-                    await writer.write_file(audio_data, tmp.name, AudioFormat.WAV, settings)
-                    
-                    # Check file was created
-                    assert os.path.exists(tmp.name)
-                    assert os.path.getsize(tmp.name) > 0
-                finally:
-                    os.unlink(tmp.name)
+        await writer.write_file(audio_data, str(path), AudioFormat.WAV, settings)
+        
+        # Check file was created
+        assert path.stat().st_size > 0
                     
     @pytest.mark.asyncio
-    async def test_write_stereo_audio(self):
+    async def test_write_stereo_audio(self, tmp_path):
         """Test writing stereo WAV file."""
         writer = AudioWriter()
-        audio_data = [0.1, 0.2, -0.1, -0.2] * 100
+        audio_data = _AUDIO_SHORT
         settings = EncodingSettings(24000, 2)  # Stereo
+        path = tmp_path / "out.wav"
         
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            try:
-                await writer.write_file(audio_data, tmp.name, AudioFormat.WAV, settings)
-                
-                # Check file was created
-                assert os.path.exists(tmp.name)
-                assert os.path.getsize(tmp.name) > 0
-            finally:
-                os.unlink(tmp.name)
+        await writer.write_file(audio_data, str(path), AudioFormat.WAV, settings)
+        
+        # Check file was created
+        assert path.stat().st_size > 0
 
 
 class TestAudioWriterIntegration:
     """Integration tests for audio writer with TTS engine."""
     
     @pytest.mark.asyncio
-    async def test_save_synthesized_audio(self):
+    async def test_save_synthesized_audio(self, tmp_path, tts):
         """Test saving synthesized audio to file."""
         # Generate audio
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice)
-        audio_data = await engine.synthesize("Hello, world!", params)
+        engine, _, params = tts
+        audio_data = engine.synthesize_sync("Hello, world!", params)
         
         # Save audio
         writer = AudioWriter()
         settings = EncodingSettings.default()
+        path = tmp_path / "out.wav"
         
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            try:
-                await writer.write_file(audio_data, tmp.name, AudioFormat.WAV, settings)
-                
-                # Check file was created and has reasonable size
-                assert os.path.exists(tmp.name)
-                file_size = os.path.getsize(tmp.name)
-                assert file_size > 1000  # Should be at least 1KB for "Hello, world!"
-                
-            finally:
-                os.unlink(tmp.name)
+        await writer.write_file(audio_data, str(path), AudioFormat.WAV, settings)
+        
+        # Check file was created and has reasonable size
+        assert path.stat().st_size > 1000  # Should be at least 1KB for "Hello, world!"
                 
     @pytest.mark.asyncio
-    async def test_save_multiple_voices(self):
+    async def test_save_multiple_voices(self, tmp_path, tts):
         """Test saving audio from different voices."""
-        engine = await TtsEngine()
+        engine, _, _ = tts
         writer = AudioWriter()
         settings = EncodingSettings.default()
         
@@ -418,108 +371,81 @@ class TestAudioWriterIntegration:
         manager = VoiceManager()
         voices = manager.get_available_voices()[:2]  # Test with 2 voices
         
-        for i, voice in enumerate(voices):
-            params = SynthesisParams(voice)
-            audio_data = await engine.synthesize(f"Hello from voice {i}", params)
-            
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                try:
-                    await writer.write_file(audio_data, tmp.name, AudioFormat.WAV, settings)
-                    
-                    # Check file was created
-                    assert os.path.exists(tmp.name)
-                    assert os.path.getsize(tmp.name) > 500
-                    
-                finally:
-                    os.unlink(tmp.name)
+        params_list = [SynthesisParams(voice) for voice in voices]
+        audio_clips = [
+            engine.synthesize_sync(f"Hello from voice {i}", params)
+            for i, params in enumerate(params_list)
+        ]
+        paths = [tmp_path / f"v{i}.wav" for i in range(len(voices))]
+        
+        await asyncio.gather(*[
+            writer.write_file(audio, str(path), AudioFormat.WAV, settings)
+            for audio, path in zip(audio_clips, paths)
+        ])
+        
+        # Check files were created
+        for path in paths:
+            assert path.stat().st_size > 500
                     
     @pytest.mark.asyncio
-    async def test_concurrent_file_writing(self):
+    async def test_concurrent_file_writing(self, tmp_path, tts):
         """Test writing multiple files concurrently."""
         # Generate audio
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice)
+        engine, _, params = tts
         
-        audio_clips = await asyncio.gather(*[
-            engine.synthesize(f"Clip number {i}", params)
+        audio_clips = [
+            engine.synthesize_sync(f"Clip number {i}", params)
             for i in range(3)
-        ])
+        ]
         
         # Write files concurrently
         writer = AudioWriter()
         settings = EncodingSettings.default()
+        paths = [tmp_path / f"clip{i}.wav" for i in range(3)]
         
-        temp_files = []
-        try:
-            for i in range(3):
-                tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-                temp_files.append(tmp.name)
-                tmp.close()
-                
-            await asyncio.gather(*[
-                writer.write_file(audio_clips[i], temp_files[i], AudioFormat.WAV, settings)
-                for i in range(3)
-            ])
-            
-            # Check all files were created
-            for tmp_file in temp_files:
-                assert os.path.exists(tmp_file)
-                assert os.path.getsize(tmp_file) > 0
-                
-        finally:
-            for tmp_file in temp_files:
-                if os.path.exists(tmp_file):
-                    os.unlink(tmp_file)
+        await asyncio.gather(*[
+            writer.write_file(audio, str(path), AudioFormat.WAV, settings)
+            for audio, path in zip(audio_clips, paths)
+        ])
+        
+        # Check all files were created
+        for path in paths:
+            assert path.stat().st_size > 0
 
 
 class TestAudioWriterErrorHandling:
     """Test audio writer error handling."""
     
     @pytest.mark.asyncio
-    async def test_write_to_invalid_path(self):
+    async def test_write_to_invalid_path(self, tmp_path):
         """Test writing to invalid path."""
         writer = AudioWriter()
-        audio_data = [0.1, 0.2, -0.1, -0.2]
+        audio_data = _AUDIO_SHORT
         settings = EncodingSettings.default()
         
         # Try to write to non-existent directory
-        invalid_path = "/nonexistent/directory/file.wav"
+        invalid_path = str(tmp_path / "missing_subdir" / "file.wav")
         
         with pytest.raises(VocalizeError):
             await writer.write_file(audio_data, invalid_path, AudioFormat.WAV, settings)
             
     @pytest.mark.asyncio
-    async def test_write_empty_audio(self):
+    async def test_write_empty_audio(self, tmp_path):
         """Test writing empty audio data."""
         writer = AudioWriter()
         settings = EncodingSettings.default()
         
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            try:
-                with pytest.raises(VocalizeError):
-                    await writer.write_file([], tmp.name, AudioFormat.WAV, settings)
-            finally:
-                if os.path.exists(tmp.name):
-                    os.unlink(tmp.name)
+        with pytest.raises(VocalizeError):
+            await writer.write_file([], str(tmp_path / "out.wav"), AudioFormat.WAV, settings)
                     
     @pytest.mark.asyncio
-    async def test_write_with_invalid_settings(self):
+    async def test_write_with_invalid_settings(self, tmp_path):
         """Test writing with invalid settings."""
         writer = AudioWriter()
-        audio_data = [0.1, 0.2, -0.1, -0.2]
+        audio_data = _AUDIO_SHORT
         
         # Invalid sample rate
         invalid_settings = EncodingSettings(0, 1)
         
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            try:
-                with pytest.raises(VocalizeError):
-                    await writer.write_file(audio_data, tmp.name, AudioFormat.WAV, invalid_settings)
-            finally:
-                if os.path.exists(tmp.name):
-                    os.unlink(tmp.name)
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+        with pytest.raises(VocalizeError):
+            await writer.write_file(audio_data, str(tmp_path / "out.wav"), AudioFormat.WAV, invalid_settings)
@@ -1,819 +1,460 @@
 """
 Comprehensive tests for the Vocalize CLI interface.
 
-Tests all CLI commands, configuration management, error handling,
-and integration scenarios with 100% coverage.
+Tests the argparse entry point, every CLI command handler, error handling,
+and integration scenarios with the model and voice managers mocked out.
 """
 
-import asyncio
 import json
-import os
-import tempfile
+import sys
 import pytest
+from dataclasses import fields
 from pathlib import Path
-from unittest.mock import Mock, patch, AsyncMock, MagicMock
-from click.testing import CliRunner
+from types import SimpleNamespace
+from unittest.mock import Mock, create_autospec
 
 from vocalize.cli import (
-    cli, speak, list_voices, play, config,
-    ConfigManager, DEFAULT_CONFIG,
-    validate_voice_id, validate_audio_format, validate_speed, validate_pitch,
-    async_synthesize_and_handle, main
-)
-from vocalize import (
-    VoiceManager, TtsEngine, AudioDevice, AudioWriter,
-    Voice, SynthesisParams, AudioFormat, EncodingSettings,
-    Gender, VoiceStyle, PlaybackState, VocalizeError
+    VocalizeComponents, create_parser, main,
+    handle_speak_command, DEFAULT_VOICE, DEFAULT_SPEED, DEFAULT_PITCH,
 )
+from vocalize.model_manager import ModelInfo, ModelManager
+from vocalize.voice_manager import VoiceInfo, VoiceManager
 
 
-class TestConfigManager:
-    """Test the ConfigManager class."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        # Use temporary directory for config
-        self.temp_dir = tempfile.mkdtemp()
-        self.config_file = Path(self.temp_dir) / "config.toml"
-        self.config_manager = ConfigManager()
-        self.config_manager.config_file = self.config_file
-        self.config_manager.config_dir = Path(self.temp_dir)
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    def test_ensure_config_dir(self):
-        """Test configuration directory creation."""
-        # Remove directory first
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-        
-        self.config_manager.ensure_config_dir()
-        assert self.config_manager.config_dir.exists()
-        assert self.config_manager.config_dir.is_dir()
-    
-    def test_load_config_default(self):
-        """Test loading default configuration when file doesn't exist."""
-        config = self.config_manager.load_config()
-        assert config == DEFAULT_CONFIG
+@pytest.fixture
+def run_main(monkeypatch):
+    """Run the CLI entry point with ``argv`` and return its exit code."""
+    def run(*argv):
+        monkeypatch.setattr(sys, 'argv', ['vocalize', *argv])
+        try:
+            main()
+        except SystemExit as exc:
+            return exc.code
+        return 0
+    return run
+
+
+@pytest.fixture(scope="class")
+def parser():
+    """The CLI argument parser, shared by the tests of a class."""
+    return create_parser()
+
+
+@pytest.fixture(scope="session")
+def kokoro_info():
+    """Read-only Kokoro model metadata shared by the models command tests."""
+    return ModelInfo(
+        id="kokoro", name="Kokoro TTS", repo_id="direct_download",
+        files=["kokoro-v1.0.onnx", "voices-v1.0.bin"], size_mb=410,
+        description="Test model",
+    )
+
+
+def voice_row_for(voice_id, name, gender, language):
+    """Build a voice row with only the VoiceInfo attributes set."""
+    voice = Mock(spec_set=[field.name for field in fields(VoiceInfo)])
+    voice.id = voice_id
+    voice.name = name
+    voice.gender = gender
+    voice.language = language
+    voice.file_path = f"voices/{voice_id}.bin"
+    return voice
+
+
+@pytest.fixture(scope="class")
+def voice_row():
+    """The af_bella voice row shared by the voice listing tests of a class."""
+    return voice_row_for("af_bella", "Bella", "female", "english")
+
+
+@pytest.fixture
+def models_mgr(monkeypatch):
+    """Mocked manager handed out by every ``ModelManager()`` call in the models command."""
+    manager = Mock(spec=ModelManager)
+    monkeypatch.setattr('vocalize.cli.ModelManager', Mock(return_value=manager))
+    return manager
+
+
+@pytest.fixture(autouse=True)
+def cli_backend(monkeypatch):
+    """Stub the CLI's model, synthesis, save and playback entry points.
+
+    Autouse so that no CLI test reaches the real backend by accident. The
+    returned namespace exposes the stubs; tests that need a failing or
+    different backend reconfigure them.
+    """
+    backend = SimpleNamespace(
+        ensure=Mock(return_value=True),
+        synthesize=Mock(return_value=VocalizeComponents.AudioData([0.1, 0.2, 0.3])),
+        save=create_autospec(VocalizeComponents.save_audio),
+        play=create_autospec(VocalizeComponents.play_audio),
+    )
+    monkeypatch.setattr('vocalize.cli.ensure_model_available', backend.ensure)
+    monkeypatch.setattr('vocalize.cli.synthesize_with_tokens', backend.synthesize)
+    monkeypatch.setattr('vocalize.cli.VocalizeComponents.save_audio', backend.save)
+    monkeypatch.setattr('vocalize.cli.VocalizeComponents.play_audio', backend.play)
+    return backend
+
+
+@pytest.fixture
+def mock_manager_stack(monkeypatch):
+    """Patch in preconfigured ``(model_manager, voice_manager)`` mocks for the handlers."""
+    model_manager = Mock(spec=ModelManager, cache_dir=Path("cache"))
+    voice_manager = Mock(spec=VoiceManager)
+    monkeypatch.setattr('vocalize.model_manager.ModelManager', Mock(return_value=model_manager))
+    monkeypatch.setattr('vocalize.voice_manager.VoiceManager', Mock(return_value=voice_manager))
+    return model_manager, voice_manager
+
+
+class TestArgumentValidation:
+    """Test argument parsing and validation for the CLI commands."""
+    
+    @pytest.mark.parametrize("raw,expected", [
+        ("1.0", 1.0), ("0.5", 0.5), ("2.5", 2.5), ("0.1", 0.1), ("3.0", 3.0),
+    ])
+    def test_parse_speed_valid(self, parser, raw, expected):
+        """Test parsing valid speed values."""
+        assert parser.parse_args(['speak', 'Hi', '--speed', raw]).speed == expected
+    
+    @pytest.mark.parametrize("raw,expected", [
+        ("0.0", 0.0), ("-0.5", -0.5), ("0.8", 0.8), ("-1.0", -1.0), ("1.0", 1.0),
+    ])
+    def test_parse_pitch_valid(self, parser, raw, expected):
+        """Test parsing valid pitch values."""
+        assert parser.parse_args(['speak', 'Hi', '--pitch', raw]).pitch == expected
+    
+    @pytest.mark.parametrize("audio_format", ["wav", "mp3", "flac", "ogg"])
+    def test_parse_audio_format_valid(self, parser, audio_format):
+        """Test parsing valid audio formats."""
+        assert parser.parse_args(['speak', 'Hi', '--format', audio_format]).format == audio_format
+    
+    @pytest.mark.parametrize("option,value,message", [
+        ('--speed', 'not_a_number', "invalid float value"),
+        ('--pitch', 'invalid', "invalid float value"),
+        ('--format', 'invalid_format', "invalid choice"),
+    ])
+    def test_parse_invalid_value(self, parser, option, value, message, capsys):
+        """Test parsing a non-numeric speed or pitch and an unsupported format."""
+        with pytest.raises(SystemExit) as excinfo:
+            parser.parse_args(['speak', 'Hi', option, value])
+        assert excinfo.value.code == 2
+        assert message in capsys.readouterr().err
+    
+    def test_parse_speak_defaults(self, parser):
+        """Test the speak command defaults."""
+        args = parser.parse_args(['speak', 'Hello'])
+        assert args.command == "speak"
+        assert args.text == "Hello"
+        assert args.model == "kokoro"
+        assert args.voice is None
+        assert args.output is None
+        assert args.play is False
+
+
+class TestSpeakHandler:
+    """Test the speak command handler."""
     
-    def test_load_config_existing_file(self):
-        """Test loading configuration from existing file."""
-        # Create test config file
-        test_config = {"default": {"voice": "test_voice"}}
-        
-        import toml
-        with open(self.config_file, 'w') as f:
-            toml.dump(test_config, f)
-        
-        config = self.config_manager.load_config()
-        assert "test_voice" in str(config)
-    
-    def test_load_config_corrupted_file(self):
-        """Test loading configuration with corrupted file."""
-        # Create corrupted file
-        with open(self.config_file, 'w') as f:
-            f.write("invalid toml content [[[")
-        
-        config = self.config_manager.load_config()
-        assert config == DEFAULT_CONFIG
-    
-    def test_save_config(self):
-        """Test saving configuration to file."""
-        test_config = {"test": {"key": "value"}}
-        self.config_manager.save_config(test_config)
-        
-        assert self.config_file.exists()
-        
-        # Verify content
-        import toml
-        with open(self.config_file, 'r') as f:
-            saved_config = toml.load(f)
-        assert saved_config == test_config
-    
-    def test_save_config_error(self):
-        """Test error handling during config save."""
-        # Make directory read-only to cause save error
-        self.config_manager.config_file = Path("/root/readonly/config.toml")
-        
-        with pytest.raises(Exception):
-            self.config_manager.save_config({"test": "data"})
-    
-    def test_get_value_existing(self):
-        """Test getting existing configuration value."""
-        self.config_manager.save_config({"section": {"key": "value"}})
-        
-        value = self.config_manager.get_value("section.key")
-        assert value == "value"
-    
-    def test_get_value_nested(self):
-        """Test getting nested configuration value."""
-        config = {"level1": {"level2": {"level3": "deep_value"}}}
-        self.config_manager.save_config(config)
-        
-        value = self.config_manager.get_value("level1.level2.level3")
-        assert value == "deep_value"
-    
-    def test_get_value_nonexistent(self):
-        """Test getting non-existent configuration value."""
-        value = self.config_manager.get_value("nonexistent.key")
-        assert value is None
-    
-    def test_set_value_new(self):
-        """Test setting new configuration value."""
-        self.config_manager.set_value("new.key", "new_value")
-        
-        value = self.config_manager.get_value("new.key")
-        assert value == "new_value"
-    
-    def test_set_value_existing(self):
-        """Test updating existing configuration value."""
-        self.config_manager.save_config({"existing": {"key": "old_value"}})
-        self.config_manager.set_value("existing.key", "new_value")
-        
-        value = self.config_manager.get_value("existing.key")
-        assert value == "new_value"
-    
-    def test_set_value_deep_nested(self):
-        """Test setting deeply nested configuration value."""
-        self.config_manager.set_value("a.b.c.d.e", "deep_value")
-        
-        value = self.config_manager.get_value("a.b.c.d.e")
-        assert value == "deep_value"
-
-
-class TestValidationFunctions:
-    """Test CLI validation functions."""
-    
-    @patch('vocalize.cli.VoiceManager')
-    def test_validate_voice_id_valid(self, mock_voice_manager):
-        """Test validation with valid voice ID."""
-        mock_manager = Mock()
-        mock_manager.is_voice_available.return_value = True
-        mock_voice_manager.return_value = mock_manager
-        
-        result = validate_voice_id("bella")
-        assert result == "bella"
-        mock_manager.is_voice_available.assert_called_once_with("bella")
-    
-    @patch('vocalize.cli.VoiceManager')
-    def test_validate_voice_id_invalid(self, mock_voice_manager):
-        """Test validation with invalid voice ID."""
-        mock_manager = Mock()
-        mock_manager.is_voice_available.return_value = False
-        mock_voice = Mock()
-        mock_voice.id = "available_voice"
-        mock_manager.get_available_voices.return_value = [mock_voice]
-        mock_voice_manager.return_value = mock_manager
-        
-        with pytest.raises(Exception) as excinfo:
-            validate_voice_id("invalid_voice")
-        
-        assert "not found" in str(excinfo.value)
-        assert "available_voice" in str(excinfo.value)
-    
-    @patch('vocalize.cli.VoiceManager')
-    def test_validate_voice_id_error(self, mock_voice_manager):
-        """Test validation with VoiceManager error."""
-        mock_voice_manager.side_effect = Exception("Manager error")
-        
-        with pytest.raises(Exception) as excinfo:
-            validate_voice_id("any_voice")
-        
-        assert "Error validating voice" in str(excinfo.value)
-    
-    def test_validate_audio_format_valid(self):
-        """Test validation with valid audio formats."""
-        assert validate_audio_format("wav") == AudioFormat.Wav
-        assert validate_audio_format("mp3") == AudioFormat.Mp3
-        assert validate_audio_format("flac") == AudioFormat.Flac
-        assert validate_audio_format("ogg") == AudioFormat.Ogg
-    
-    def test_validate_audio_format_invalid(self):
-        """Test validation with invalid audio format."""
-        with pytest.raises(Exception) as excinfo:
-            validate_audio_format("invalid_format")
-        
-        assert "Invalid audio format" in str(excinfo.value)
-        assert "wav, mp3, flac, ogg" in str(excinfo.value)
-    
-    def test_validate_speed_valid(self):
-        """Test validation with valid speed values."""
-        assert validate_speed("1.0") == 1.0
-        assert validate_speed("0.5") == 0.5
-        assert validate_speed("2.5") == 2.5
-        assert validate_speed("0.1") == 0.1
-        assert validate_speed("3.0") == 3.0
-    
-    def test_validate_speed_invalid_range(self):
-        """Test validation with speed values out of range."""
-        with pytest.raises(Exception) as excinfo:
-            validate_speed("0.05")
-        assert "between 0.1 and 3.0" in str(excinfo.value)
-        
-        with pytest.raises(Exception) as excinfo:
-            validate_speed("5.0")
-        assert "between 0.1 and 3.0" in str(excinfo.value)
-    
-    def test_validate_speed_invalid_format(self):
-        """Test validation with non-numeric speed."""
-        with pytest.raises(Exception) as excinfo:
-            validate_speed("not_a_number")
-        assert "must be a number" in str(excinfo.value)
-    
-    def test_validate_pitch_valid(self):
-        """Test validation with valid pitch values."""
-        assert validate_pitch("0.0") == 0.0
-        assert validate_pitch("-0.5") == -0.5
-        assert validate_pitch("0.8") == 0.8
-        assert validate_pitch("-1.0") == -1.0
-        assert validate_pitch("1.0") == 1.0
-    
-    def test_validate_pitch_invalid_range(self):
-        """Test validation with pitch values out of range."""
-        with pytest.raises(Exception) as excinfo:
-            validate_pitch("-1.5")
-        assert "between -1.0 and 1.0" in str(excinfo.value)
-        
-        with pytest.raises(Exception) as excinfo:
-            validate_pitch("2.0")
-        assert "between -1.0 and 1.0" in str(excinfo.value)
-    
-    def test_validate_pitch_invalid_format(self):
-        """Test validation with non-numeric pitch."""
-        with pytest.raises(Exception) as excinfo:
-            validate_pitch("invalid")
-        assert "must be a number" in str(excinfo.value)
-
-
-class TestAsyncSynthesizeAndHandle:
-    """Test the async synthesis function."""
-    
-    @pytest.mark.asyncio
-    @patch('vocalize.cli.VoiceManager')
-    @patch('vocalize.cli.TtsEngine')
-    @patch('vocalize.cli.AudioDevice')
-    @patch('vocalize.cli.AudioWriter')
-    async def test_synthesis_basic(self, mock_writer, mock_device, mock_engine, mock_voice_manager):
-        """Test basic synthesis without output or playback."""
-        # Setup mocks
-        mock_voice = Mock()
-        mock_voice.sample_rate = 24000
-        mock_voice.with_speed.return_value = mock_voice
-        mock_voice.with_pitch.return_value = mock_voice
-        
-        mock_manager = Mock()
-        mock_manager.get_voice.return_value = mock_voice
-        mock_voice_manager.return_value = mock_manager
-        
-        mock_engine_instance = AsyncMock()
-        mock_engine_instance.synthesize.return_value = [0.1, 0.2, 0.3]
-        mock_engine.return_value = mock_engine_instance
-        
-        # Test synthesis
-        await async_synthesize_and_handle(
-            text="Hello", voice_id="bella", speed=1.0, pitch=0.0,
-            play=False, output=None, format_name="wav", streaming=False, verbose=False
-        )
+    def test_speak_basic(self, parser, mock_manager_stack, cli_backend, capsys):
+        """Test synthesis without output or playback."""
+        args = parser.parse_args(['speak', 'Hello'])
+        handle_speak_command(args)
         
         # Verify calls
-        mock_manager.get_voice.assert_called_once_with("bella")
-        mock_engine_instance.synthesize.assert_called_once()
-    
-    @pytest.mark.asyncio
-    @patch('vocalize.cli.VoiceManager')
-    @patch('vocalize.cli.TtsEngine')
-    @patch('vocalize.cli.AudioWriter')
-    async def test_synthesis_with_output(self, mock_writer, mock_engine, mock_voice_manager):
+        cli_backend.ensure.assert_called_once_with("kokoro", manager=mock_manager_stack[0])
+        cli_backend.synthesize.assert_called_once_with(
+            "Hello", DEFAULT_VOICE, DEFAULT_SPEED, DEFAULT_PITCH, "kokoro"
+        )
+        assert "Use --output" in capsys.readouterr().out
+    
+    def test_speak_with_output(self, parser, mock_manager_stack, cli_backend, tmp_path):
         """Test synthesis with file output."""
-        # Setup mocks
-        mock_voice = Mock()
-        mock_voice.sample_rate = 24000
-        mock_voice.with_speed.return_value = mock_voice
-        mock_voice.with_pitch.return_value = mock_voice
-        
-        mock_manager = Mock()
-        mock_manager.get_voice.return_value = mock_voice
-        mock_voice_manager.return_value = mock_manager
-        
-        mock_engine_instance = AsyncMock()
-        mock_engine_instance.synthesize.return_value = [0.1, 0.2, 0.3]
-        mock_engine.return_value = mock_engine_instance
-        
-        mock_writer_instance = AsyncMock()
-        mock_writer.return_value = mock_writer_instance
+        output_path = str(tmp_path / "output.wav")
+        args = parser.parse_args(['speak', 'Hello', '--output', output_path])
+        handle_speak_command(args)
         
-        # Test with output file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            output_path = tmp.name
-        
-        try:
-            await async_synthesize_and_handle(
-                text="Hello", voice_id="bella", speed=1.0, pitch=0.0,
-                play=False, output=output_path, format_name="wav", streaming=False, verbose=True
-            )
-            
-            # Verify file writing was called
-            mock_writer_instance.write_file.assert_called_once()
-        finally:
-            os.unlink(output_path)
-    
-    @pytest.mark.asyncio
-    @patch('vocalize.cli.VoiceManager')
-    @patch('vocalize.cli.TtsEngine')
-    @patch('vocalize.cli.AudioDevice')
-    async def test_synthesis_with_playback(self, mock_device, mock_engine, mock_voice_manager):
-        """Test synthesis with audio playback."""
-        # Setup mocks
-        mock_voice = Mock()
-        mock_voice.sample_rate = 24000
-        mock_voice.with_speed.return_value = mock_voice
-        mock_voice.with_pitch.return_value = mock_voice
-        
-        mock_manager = Mock()
-        mock_manager.get_voice.return_value = mock_voice
-        mock_voice_manager.return_value = mock_manager
-        
-        mock_engine_instance = AsyncMock()
-        mock_engine_instance.synthesize.return_value = [0.1, 0.2, 0.3]
-        mock_engine.return_value = mock_engine_instance
-        
-        mock_device_instance = AsyncMock()
-        mock_device_instance.get_state.side_effect = [PlaybackState.Playing, PlaybackState.Stopped]
-        mock_device.return_value = mock_device_instance
-        
-        # Test with playback
-        await async_synthesize_and_handle(
-            text="Hello", voice_id="bella", speed=1.0, pitch=0.0,
-            play=True, output=None, format_name="wav", streaming=False, verbose=True
+        # Verify file writing was called
+        cli_backend.save.assert_called_once_with(
+            cli_backend.synthesize.return_value, output_path, "wav"
         )
+    
+    def test_speak_with_playback(self, parser, mock_manager_stack, cli_backend):
+        """Test synthesis with audio playback."""
+        args = parser.parse_args(['speak', 'Hello', '--voice', 'af_bella', '--play'])
+        handle_speak_command(args)
         
         # Verify playback was called
-        mock_device_instance.play.assert_called_once()
-    
-    @pytest.mark.asyncio
-    @patch('vocalize.cli.VoiceManager')
-    @patch('vocalize.cli.TtsEngine')
-    async def test_synthesis_streaming(self, mock_engine, mock_voice_manager):
-        """Test streaming synthesis."""
-        # Setup mocks
-        mock_voice = Mock()
-        mock_voice.sample_rate = 24000
-        mock_voice.with_speed.return_value = mock_voice
-        mock_voice.with_pitch.return_value = mock_voice
-        
-        mock_manager = Mock()
-        mock_manager.get_voice.return_value = mock_voice
-        mock_voice_manager.return_value = mock_manager
-        
-        mock_engine_instance = AsyncMock()
-        mock_engine_instance.synthesize_streaming.return_value = [[0.1, 0.2], [0.3, 0.4]]
-        mock_engine.return_value = mock_engine_instance
-        
-        # Test streaming
-        await async_synthesize_and_handle(
-            text="Hello world", voice_id="bella", speed=1.0, pitch=0.0,
-            play=False, output=None, format_name="wav", streaming=True, verbose=True
+        cli_backend.synthesize.assert_called_once_with(
+            "Hello", "af_bella", DEFAULT_SPEED, DEFAULT_PITCH, "kokoro"
         )
+        cli_backend.play.assert_called_once_with(cli_backend.synthesize.return_value)
+    
+    def test_speak_verbose(self, parser, mock_manager_stack, capsys):
+        """Test synthesis with timing output."""
+        args = parser.parse_args(['--verbose', 'speak', 'Hello'])
+        handle_speak_command(args)
         
-        # Verify streaming synthesis was called
-        mock_engine_instance.synthesize_streaming.assert_called_once()
+        out = capsys.readouterr().out
+        assert "using default: af_alloy" in out
+        assert "Total execution time" in out
     
-    @pytest.mark.asyncio
-    @patch('vocalize.cli.VoiceManager')
-    async def test_synthesis_voice_error(self, mock_voice_manager):
-        """Test synthesis with VoiceManager error."""
-        mock_manager = Mock()
-        mock_manager.get_voice.side_effect = VocalizeError("Voice not found")
-        mock_voice_manager.return_value = mock_manager
+    def test_speak_model_unavailable(self, parser, mock_manager_stack, cli_backend, capsys):
+        """Test synthesis when the model cannot be downloaded."""
+        cli_backend.ensure.return_value = False
         
-        with pytest.raises(Exception) as excinfo:
-            await async_synthesize_and_handle(
-                text="Hello", voice_id="invalid", speed=1.0, pitch=0.0,
-                play=False, output=None, format_name="wav", streaming=False, verbose=False
-            )
+        args = parser.parse_args(['speak', 'Hello'])
+        handle_speak_command(args)
         
-        assert "TTS Error" in str(excinfo.value)
+        cli_backend.synthesize.assert_not_called()
+        assert "Failed to download model: kokoro" in capsys.readouterr().out
     
-    @pytest.mark.asyncio
-    @patch('vocalize.cli.VoiceManager')
-    @patch('vocalize.cli.TtsEngine')
-    async def test_synthesis_engine_error(self, mock_engine, mock_voice_manager):
-        """Test synthesis with TTS engine error."""
-        mock_voice = Mock()
-        mock_voice.with_speed.return_value = mock_voice
-        mock_voice.with_pitch.return_value = mock_voice
+    def test_speak_synthesis_error(self, parser, mock_manager_stack, cli_backend):
+        """Test synthesis with a TTS engine error."""
+        cli_backend.synthesize.side_effect = RuntimeError("Engine failure")
         
-        mock_manager = Mock()
-        mock_manager.get_voice.return_value = mock_voice
-        mock_voice_manager.return_value = mock_manager
+        args = parser.parse_args(['speak', 'Hello'])
+        with pytest.raises(RuntimeError) as excinfo:
+            handle_speak_command(args)
         
-        mock_engine_instance = AsyncMock()
-        mock_engine_instance.synthesize.side_effect = Exception("Engine failure")
-        mock_engine.return_value = mock_engine_instance
+        assert "Engine failure" in str(excinfo.value)
+    
+    def test_speak_keyboard_interrupt(self, parser, mock_manager_stack, cli_backend, capsys):
+        """Test that a keyboard interrupt during synthesis propagates out of the handler."""
+        cli_backend.synthesize.side_effect = KeyboardInterrupt()
         
-        with pytest.raises(Exception) as excinfo:
-            await async_synthesize_and_handle(
-                text="Hello", voice_id="bella", speed=1.0, pitch=0.0,
-                play=False, output=None, format_name="wav", streaming=False, verbose=False
-            )
+        args = parser.parse_args(['speak', 'Hello', '--output', 'out.wav'])
+        with pytest.raises(KeyboardInterrupt):
+            handle_speak_command(args)
         
-        assert "Unexpected error" in str(excinfo.value)
+        cli_backend.save.assert_not_called()
+        assert "Synthesizing text: 'Hello'" in capsys.readouterr().out
 
 
 class TestCliCommands:
-    """Test CLI commands using Click's test runner."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+    """Test CLI commands through the main entry point."""
     
-    def test_cli_help(self):
+    def test_cli_help(self, run_main, capsys):
         """Test CLI help output."""
-        result = self.runner.invoke(cli, ['--help'])
-        assert result.exit_code == 0
-        assert "Vocalize" in result.output
-        assert "text-to-speech" in result.output
+        assert run_main('--help') == 0
+        out = capsys.readouterr().out
+        assert "text-to-speech" in out
+        assert "list-voices" in out
     
-    def test_cli_version(self):
+    def test_cli_version(self, run_main, capsys):
         """Test CLI version output."""
-        result = self.runner.invoke(cli, ['--version'])
-        assert result.exit_code == 0
+        assert run_main('--version') == 0
+        assert "vocalize 0.1.0" in capsys.readouterr().out
     
-    @patch('vocalize.cli.asyncio.run')
-    @patch('vocalize.cli.validate_voice_id')
-    def test_speak_command_basic(self, mock_validate, mock_asyncio):
+    def test_cli_no_command(self, run_main, capsys):
+        """Test CLI without a command."""
+        assert run_main() == 1
+        assert "usage: vocalize" in capsys.readouterr().out
+    
+    def test_speak_command_basic(self, monkeypatch, run_main):
         """Test basic speak command."""
-        mock_validate.return_value = "bella"
-        mock_asyncio.return_value = None
-        
-        result = self.runner.invoke(speak, ['Hello world'])
-        assert result.exit_code == 0
-        mock_asyncio.assert_called_once()
-    
-    @patch('vocalize.cli.asyncio.run')
-    @patch('vocalize.cli.validate_voice_id')
-    @patch('vocalize.cli.validate_speed')
-    @patch('vocalize.cli.validate_pitch')
-    def test_speak_command_with_options(self, mock_pitch, mock_speed, mock_validate, mock_asyncio):
+        mock_handle = Mock()
+        monkeypatch.setattr('vocalize.cli.handle_speak_command', mock_handle)
+        
+        assert run_main('speak', 'Hello world') == 0
+        mock_handle.assert_called_once()
+        assert mock_handle.call_args.args[0].text == "Hello world"
+    
+    def test_speak_command_with_options(self, monkeypatch, run_main):
         """Test speak command with all options."""
-        mock_validate.return_value = "bella"
-        mock_speed.return_value = 1.5
-        mock_pitch.return_value = 0.5
-        mock_asyncio.return_value = None
-        
-        result = self.runner.invoke(speak, [
-            'Hello world',
-            '--voice', 'bella',
+        mock_handle = Mock()
+        monkeypatch.setattr('vocalize.cli.handle_speak_command', mock_handle)
+        
+        assert run_main(
+            '--verbose', 'speak', 'Hello world',
+            '--voice', 'af_bella',
             '--speed', '1.5',
             '--pitch', '0.5',
+            '--format', 'flac',
             '--play',
-            '--streaming',
-            '--verbose'
-        ])
-        assert result.exit_code == 0
-    
-    @patch('vocalize.cli.asyncio.run')
-    def test_speak_command_keyboard_interrupt(self, mock_asyncio):
-        """Test speak command with keyboard interrupt."""
-        mock_asyncio.side_effect = KeyboardInterrupt()
-        
-        result = self.runner.invoke(speak, ['Hello'])
-        assert result.exit_code == 1
-        assert "cancelled by user" in result.output
-    
-    @patch('vocalize.cli.VoiceManager')
-    def test_list_voices_command_basic(self, mock_voice_manager):
+        ) == 0
+        
+        args = mock_handle.call_args.args[0]
+        assert args.voice == "af_bella"
+        assert args.speed == 1.5
+        assert args.pitch == 0.5
+        assert args.format == "flac"
+        assert args.play is True
+        assert args.verbose is True
+    
+    def test_list_voices_command_basic(self, mock_manager_stack, run_main, voice_row, capsys):
         """Test basic list-voices command."""
-        mock_voice = Mock()
-        mock_voice.id = "bella"
-        mock_voice.name = "Bella"
-        mock_voice.gender = Gender.Female
-        mock_voice.language = "en-US"
-        mock_voice.style = VoiceStyle.Natural
-        mock_voice.available = True
-        mock_voice.description = "Friendly voice"
-        
-        mock_manager = Mock()
-        mock_manager.get_available_voices.return_value = [mock_voice]
-        mock_voice_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(list_voices)
-        assert result.exit_code == 0
-        assert "bella" in result.output
-        assert "Bella" in result.output
-    
-    @patch('vocalize.cli.VoiceManager')
-    def test_list_voices_command_json(self, mock_voice_manager):
+        _, mock_manager = mock_manager_stack
+        mock_manager.discover_voices.return_value = [voice_row]
+        
+        assert run_main('list-voices') == 0
+        out = capsys.readouterr().out
+        assert "af_bella" in out
+        assert "Bella" in out
+    
+    def test_list_voices_command_json(self, mock_manager_stack, run_main, voice_row, capsys):
         """Test list-voices command with JSON output."""
-        mock_voice = Mock()
-        mock_voice.id = "bella"
-        mock_voice.name = "Bella"
-        mock_voice.gender = Gender.Female
-        mock_voice.language = "en-US"
-        mock_voice.style = VoiceStyle.Natural
-        mock_voice.sample_rate = 24000
-        mock_voice.available = True
-        mock_voice.description = "Friendly voice"
-        
-        mock_manager = Mock()
-        mock_manager.get_available_voices.return_value = [mock_voice]
-        mock_voice_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(list_voices, ['--format', 'json'])
-        assert result.exit_code == 0
-        
-        # Parse JSON output
-        output_lines = [line for line in result.output.split('\n') if line.strip()]
-        json_start = None
-        for i, line in enumerate(output_lines):
-            if line.strip().startswith('['):
-                json_start = i
-                break
-        
-        if json_start is not None:
-            json_output = '\n'.join(output_lines[json_start:])
-            if json_output.strip():
-                data = json.loads(json_output)
-                assert isinstance(data, list)
-                assert len(data) > 0
-                assert data[0]['id'] == 'bella'
-    
-    @patch('vocalize.cli.VoiceManager')
-    def test_list_voices_command_filtered(self, mock_voice_manager):
+        _, mock_manager = mock_manager_stack
+        mock_manager.discover_voices.return_value = [voice_row]
+        
+        assert run_main('list-voices', '--json') == 0
+        
+        # Parse JSON output; the array starts at the first '['
+        out = capsys.readouterr().out
+        payload_start = out.find('[')
+        assert payload_start != -1
+        data = json.loads(out[payload_start:])
+        assert isinstance(data, list)
+        assert data[0]['id'] == 'af_bella'
+        assert data[0]['file_path'] == 'voices/af_bella.bin'
+    
+    def test_list_voices_command_filtered(self, mock_manager_stack, run_main, voice_row, capsys):
         """Test list-voices command with filters."""
-        mock_voice = Mock()
-        mock_voice.id = "bella"
-        mock_voice.gender = Gender.Female
-        mock_voice.language = "en-US"
-        mock_voice.style = VoiceStyle.Natural
-        mock_voice.supports_language.return_value = True
-        
-        mock_manager = Mock()
-        mock_manager.get_available_voices.return_value = [mock_voice]
-        mock_voice_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(list_voices, [
-            '--gender', 'female',
-            '--language', 'en-US',
-            '--style', 'natural'
-        ])
-        assert result.exit_code == 0
-    
-    @patch('vocalize.cli.VoiceManager')
-    def test_list_voices_command_no_voices(self, mock_voice_manager):
-        """Test list-voices command with no matching voices."""
-        mock_manager = Mock()
-        mock_manager.get_available_voices.return_value = []
-        mock_voice_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(list_voices, ['--gender', 'neutral'])
-        assert result.exit_code == 0
-        assert "No voices found" in result.output
-    
-    @patch('vocalize.cli.VoiceManager')
-    def test_list_voices_command_error(self, mock_voice_manager):
+        _, mock_manager = mock_manager_stack
+        mock_manager.discover_voices.return_value = [
+            voice_row, voice_row_for("jm_kumo", "Kumo", "male", "japanese"),
+        ]
+        
+        assert run_main('list-voices', '--gender', 'female', '--language', 'English') == 0
+        out = capsys.readouterr().out
+        assert "af_bella" in out
+        assert "jm_kumo" not in out
+    
+    def test_list_voices_command_no_voices(self, mock_manager_stack, run_main, capsys):
+        """Test list-voices command with no voices after ensuring the model."""
+        _, mock_manager = mock_manager_stack
+        mock_manager.discover_voices.return_value = []
+        
+        assert run_main('list-voices') == 0
+        assert "No voices found" in capsys.readouterr().out
+        assert mock_manager.discover_voices.call_count == 2
+    
+    def test_list_voices_command_error(self, monkeypatch, mock_manager_stack, run_main, capsys):
         """Test list-voices command with VoiceManager error."""
-        mock_voice_manager.side_effect = Exception("Manager error")
+        monkeypatch.setattr(
+            'vocalize.voice_manager.VoiceManager', Mock(side_effect=Exception("Manager error"))
+        )
         
-        result = self.runner.invoke(list_voices)
-        assert result.exit_code == 1
-        assert "Error listing voices" in result.output
+        assert run_main('list-voices') == 1
+        assert "Error: Manager error" in capsys.readouterr().out
     
-    @patch('vocalize.cli.asyncio.run')
-    def test_play_command_basic(self, mock_asyncio):
+    def test_play_command_basic(self, run_main, tmp_path, capsys):
         """Test basic play command."""
-        mock_asyncio.return_value = None
-        
-        # Create temporary audio file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp.write(b"fake audio data")
-            audio_file = tmp.name
+        audio_file = tmp_path / "audio.wav"
+        audio_file.write_bytes(b"fake audio data")
         
-        try:
-            result = self.runner.invoke(play, [audio_file])
-            assert result.exit_code == 0
-            mock_asyncio.assert_called_once()
-        finally:
-            os.unlink(audio_file)
+        assert run_main('play', str(audio_file)) == 0
+        assert "Playing audio file" in capsys.readouterr().out
     
-    def test_play_command_nonexistent_file(self):
+    def test_play_command_nonexistent_file(self, run_main, tmp_path, capsys):
         """Test play command with non-existent file."""
-        result = self.runner.invoke(play, ['/nonexistent/file.wav'])
-        assert result.exit_code == 2  # Click file validation error
-    
-    @patch('vocalize.cli.asyncio.run')
-    def test_play_command_keyboard_interrupt(self, mock_asyncio):
-        """Test play command with keyboard interrupt."""
-        mock_asyncio.side_effect = KeyboardInterrupt()
+        assert run_main('play', str(tmp_path / 'missing.wav')) == 1
+        assert "File not found" in capsys.readouterr().out
+
+
+class TestModelsCommands:
+    """Test model management CLI commands."""
+    
+    def test_models_no_action(self, models_mgr, run_main, capsys):
+        """Test models command without an action."""
+        assert run_main('models') == 0
+        assert "No model action specified" in capsys.readouterr().out
+    
+    def test_models_list(self, models_mgr, run_main, kokoro_info, tmp_path, capsys):
+        """Test models list command."""
+        models_mgr.list_available_models.return_value = ["kokoro"]
+        models_mgr.get_model_info.return_value = kokoro_info
+        models_mgr.is_model_cached.return_value = True
+        models_mgr.get_cache_size.return_value = "410.0 MB"
+        models_mgr.cache_dir = tmp_path
+        
+        assert run_main('models', 'list') == 0
+        out = capsys.readouterr().out
+        assert "Kokoro TTS" in out
+        assert "cached" in out
+        assert "410.0 MB" in out
+    
+    @pytest.mark.parametrize("argv,succeeded,force,exit_code,message", [
+        (['kokoro'], True, False, 0, "Successfully downloaded kokoro"),
+        (['kokoro', '--force'], True, True, 0, "Successfully downloaded kokoro"),
+        (['kokoro'], False, False, 1, "Failed to download kokoro"),
+    ])
+    def test_models_download(self, models_mgr, run_main, capsys, argv, succeeded, force, exit_code, message):
+        """Test models download command, with and without --force, and when it fails."""
+        models_mgr.download_model.return_value = succeeded
+        
+        assert run_main('models', 'download', *argv) == exit_code
+        models_mgr.download_model.assert_called_once_with('kokoro', force=force)
+        assert message in capsys.readouterr().out
+    
+    @pytest.mark.parametrize("argv,cleared,model_id,exit_code", [
+        ([], True, None, 0),
+        (['kokoro'], True, 'kokoro', 0),
+        ([], False, None, 1),
+    ])
+    def test_models_clear(self, models_mgr, run_main, capsys, argv, cleared, model_id, exit_code):
+        """Test models clear command for all models, for one model, and when it fails."""
+        models_mgr.clear_cache.return_value = cleared
+        
+        assert run_main('models', 'clear', *argv) == exit_code
+        models_mgr.clear_cache.assert_called_once_with(model_id)
+        if not cleared:
+            assert "Failed to clear cache" in capsys.readouterr().out
+    
+    def test_models_status_cached(self, models_mgr, run_main, kokoro_info, tmp_path, capsys):
+        """Test models status command for a cached model."""
+        for filename in kokoro_info.files:
+            (tmp_path / filename).write_bytes(b"\0" * 16)
+        
+        models_mgr.list_available_models.return_value = ["kokoro"]
+        models_mgr.get_model_info.return_value = kokoro_info
+        models_mgr.get_model_path.side_effect = (
+            lambda model_id, filename: tmp_path / filename
+        )
         
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp.write(b"fake audio data")
-            audio_file = tmp.name
+        assert run_main('models', 'status', 'kokoro') == 0
+        out = capsys.readouterr().out
+        assert "Status: ✅ Cached" in out
+        assert "kokoro-v1.0.onnx: 16 bytes" in out
+    
+    def test_models_status_unknown(self, models_mgr, run_main, capsys):
+        """Test models status command for an unknown model."""
+        models_mgr.list_available_models.return_value = ["kokoro"]
         
-        try:
-            result = self.runner.invoke(play, [audio_file])
-            assert result.exit_code == 1
-            assert "stopped by user" in result.output
-        finally:
-            os.unlink(audio_file)
-
-
-class TestConfigCommands:
-    """Test configuration CLI commands."""
-    
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    @patch('vocalize.cli.ConfigManager')
-    def test_config_get_all(self, mock_config_manager):
-        """Test config get command without key."""
-        mock_manager = Mock()
-        mock_manager.load_config.return_value = {"test": "value"}
-        mock_config_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(config, ['get'])
-        assert result.exit_code == 0
-        assert "test" in result.output
-    
-    @patch('vocalize.cli.ConfigManager')
-    def test_config_get_specific_key(self, mock_config_manager):
-        """Test config get command with specific key."""
-        mock_manager = Mock()
-        mock_manager.get_value.return_value = "test_value"
-        mock_config_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(config, ['get', 'test.key'])
-        assert result.exit_code == 0
-        assert "test_value" in result.output
-    
-    @patch('vocalize.cli.ConfigManager')
-    def test_config_get_nonexistent_key(self, mock_config_manager):
-        """Test config get command with non-existent key."""
-        mock_manager = Mock()
-        mock_manager.get_value.return_value = None
-        mock_config_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(config, ['get', 'nonexistent.key'])
-        assert result.exit_code == 1
-        assert "not found" in result.output
-    
-    @patch('vocalize.cli.ConfigManager')
-    def test_config_get_dict_value(self, mock_config_manager):
-        """Test config get command with dictionary value."""
-        mock_manager = Mock()
-        mock_manager.get_value.return_value = {"nested": "value"}
-        mock_config_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(config, ['get', 'section'])
-        assert result.exit_code == 0
-        # Should output JSON format for dict values
-        assert "{" in result.output
-    
-    @patch('vocalize.cli.ConfigManager')
-    def test_config_set_string(self, mock_config_manager):
-        """Test config set command with string value."""
-        mock_manager = Mock()
-        mock_config_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(config, ['set', 'test.key', 'string_value'])
-        assert result.exit_code == 0
-        mock_manager.set_value.assert_called_once_with('test.key', 'string_value')
-        assert "Set test.key = string_value" in result.output
-    
-    @patch('vocalize.cli.ConfigManager')
-    def test_config_set_boolean(self, mock_config_manager):
-        """Test config set command with boolean value."""
-        mock_manager = Mock()
-        mock_config_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(config, ['set', 'test.flag', 'true'])
-        assert result.exit_code == 0
-        mock_manager.set_value.assert_called_once_with('test.flag', True)
-    
-    @patch('vocalize.cli.ConfigManager')
-    def test_config_set_integer(self, mock_config_manager):
-        """Test config set command with integer value."""
-        mock_manager = Mock()
-        mock_config_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(config, ['set', 'test.number', '42'])
-        assert result.exit_code == 0
-        mock_manager.set_value.assert_called_once_with('test.number', 42)
-    
-    @patch('vocalize.cli.ConfigManager')
-    def test_config_set_float(self, mock_config_manager):
-        """Test config set command with float value."""
-        mock_manager = Mock()
-        mock_config_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(config, ['set', 'test.float', '3.14'])
-        assert result.exit_code == 0
-        mock_manager.set_value.assert_called_once_with('test.float', 3.14)
-    
-    @patch('vocalize.cli.ConfigManager')
-    def test_config_set_error(self, mock_config_manager):
-        """Test config set command with error."""
-        mock_manager = Mock()
-        mock_manager.set_value.side_effect = Exception("Set error")
-        mock_config_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(config, ['set', 'test.key', 'value'])
-        assert result.exit_code == 1
-        assert "Error setting configuration" in result.output
-    
-    @patch('vocalize.cli.ConfigManager')
-    def test_config_list(self, mock_config_manager):
-        """Test config list command."""
-        mock_manager = Mock()
-        mock_manager.load_config.return_value = {
-            "section1": {"key1": "value1"},
-            "section2": {"key2": "value2"}
-        }
-        mock_config_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(config, ['list'])
-        assert result.exit_code == 0
-        assert "section1" in result.output
-        assert "section2" in result.output
-        assert "key1" in result.output
-        assert "key2" in result.output
-    
-    @patch('vocalize.cli.ConfigManager')
-    def test_config_reset(self, mock_config_manager):
-        """Test config reset command."""
-        mock_manager = Mock()
-        mock_config_manager.return_value = mock_manager
-        
-        # Simulate user confirmation
-        result = self.runner.invoke(config, ['reset'], input='y\n')
-        assert result.exit_code == 0
-        mock_manager.save_config.assert_called_once()
-        assert "reset to defaults" in result.output
-    
-    @patch('vocalize.cli.ConfigManager')
-    def test_config_reset_cancel(self, mock_config_manager):
-        """Test config reset command with cancellation."""
-        mock_manager = Mock()
-        mock_config_manager.return_value = mock_manager
-        
-        # Simulate user cancellation
-        result = self.runner.invoke(config, ['reset'], input='n\n')
-        assert result.exit_code == 1  # Aborted
-        mock_manager.save_config.assert_not_called()
-    
-    @patch('vocalize.cli.ConfigManager')
-    def test_config_reset_error(self, mock_config_manager):
-        """Test config reset command with error."""
-        mock_manager = Mock()
-        mock_manager.save_config.side_effect = Exception("Reset error")
-        mock_config_manager.return_value = mock_manager
-        
-        result = self.runner.invoke(config, ['reset'], input='y\n')
-        assert result.exit_code == 1
-        assert "Error resetting configuration" in result.output
+        assert run_main('models', 'status', 'unknown') == 1
+        assert "Unknown model: unknown" in capsys.readouterr().out
 
 
 class TestMainFunction:
     """Test the main entry point function."""
     
-    @patch('vocalize.cli.cli')
-    def test_main_normal(self, mock_cli):
+    def test_main_normal(self, monkeypatch):
         """Test main function normal execution."""
-        mock_cli.return_value = None
+        mock_handle = Mock()
+        monkeypatch.setattr('vocalize.cli.handle_list_voices_command', mock_handle)
+        monkeypatch.setattr(sys, 'argv', ['vocalize', 'list-voices'])
         
         main()
-        mock_cli.assert_called_once()
+        mock_handle.assert_called_once()
     
-    @patch('vocalize.cli.cli')
-    def test_main_keyboard_interrupt(self, mock_cli):
+    def test_main_keyboard_interrupt(self, monkeypatch, capsys):
         """Test main function with keyboard interrupt."""
-        mock_cli.side_effect = KeyboardInterrupt()
+        monkeypatch.setattr(
+            'vocalize.cli.handle_list_voices_command', Mock(side_effect=KeyboardInterrupt())
+        )
+        monkeypatch.setattr(sys, 'argv', ['vocalize', 'list-voices'])
         
         with pytest.raises(SystemExit) as excinfo:
             main()
         
-        assert excinfo.value.code == 1
+        assert excinfo.value.code == 130
+        assert "cancelled by user" in capsys.readouterr().out
     
-    @patch('vocalize.cli.cli')
-    def test_main_unexpected_error(self, mock_cli):
+    def test_main_unexpected_error(self, monkeypatch):
         """Test main function with unexpected error."""
-        mock_cli.side_effect = Exception("Unexpected error")
+        monkeypatch.setattr(
+            'vocalize.cli.handle_list_voices_command',
+            Mock(side_effect=Exception("Unexpected error")),
+        )
+        monkeypatch.setattr(sys, 'argv', ['vocalize', 'list-voices'])
         
         with pytest.raises(SystemExit) as excinfo:
             main()
@@ -824,145 +465,65 @@ class TestMainFunction:
 class TestIntegrationScenarios:
     """Test integration scenarios combining multiple CLI operations."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-        self.temp_dir = tempfile.mkdtemp()
-    
-    def teardown_method(self):
-        """Clean up test fixtures."""
-        import shutil
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
-    
-    @patch('vocalize.cli.ConfigManager')
-    @patch('vocalize.cli.asyncio.run')
-    @patch('vocalize.cli.validate_voice_id')
-    def test_config_and_speak_integration(self, mock_validate, mock_asyncio, mock_config_manager):
-        """Test configuration setting followed by speak command."""
-        mock_manager = Mock()
-        mock_manager.load_config.return_value = DEFAULT_CONFIG.copy()
-        mock_config_manager.return_value = mock_manager
-        mock_validate.return_value = "bella"
-        mock_asyncio.return_value = None
-        
-        # Set configuration
-        result1 = self.runner.invoke(config, ['set', 'default.voice', 'bella'])
-        assert result1.exit_code == 0
-        
-        # Use configuration in speak command
-        result2 = self.runner.invoke(speak, ['Hello world'])
-        assert result2.exit_code == 0
-    
-    @patch('vocalize.cli.VoiceManager')
-    @patch('vocalize.cli.asyncio.run')
-    @patch('vocalize.cli.validate_voice_id')
-    def test_list_and_speak_integration(self, mock_validate, mock_asyncio, mock_voice_manager):
+    def test_download_and_speak_integration(self, monkeypatch, mock_manager_stack, cli_backend, run_main):
+        """Test downloading a model followed by a speak command."""
+        mock_manager, _ = mock_manager_stack
+        mock_manager.download_model.return_value = True
+        monkeypatch.setattr('vocalize.cli.ModelManager', Mock(return_value=mock_manager))
+        
+        # Download the model
+        assert run_main('models', 'download', 'kokoro') == 0
+        
+        # Use it in a speak command
+        assert run_main('speak', 'Hello world') == 0
+        cli_backend.synthesize.assert_called_once()
+    
+    def test_list_and_speak_integration(self, mock_manager_stack, cli_backend, run_main, voice_row, capsys):
         """Test listing voices followed by using one for synthesis."""
-        mock_voice = Mock()
-        mock_voice.id = "bella"
-        mock_voice.name = "Bella"
-        mock_voice.gender = Gender.Female
-        mock_voice.language = "en-US"
-        mock_voice.style = VoiceStyle.Natural
-        mock_voice.available = True
-        mock_voice.description = "Friendly voice"
-        
-        mock_manager = Mock()
-        mock_manager.get_available_voices.return_value = [mock_voice]
-        mock_voice_manager.return_value = mock_manager
-        mock_validate.return_value = "bella"
-        mock_asyncio.return_value = None
+        _, mock_manager = mock_manager_stack
+        mock_manager.discover_voices.return_value = [voice_row]
         
         # List voices
-        result1 = self.runner.invoke(list_voices)
-        assert result1.exit_code == 0
-        assert "bella" in result1.output
+        assert run_main('list-voices') == 0
+        assert "af_bella" in capsys.readouterr().out
         
         # Use the voice for synthesis
-        result2 = self.runner.invoke(speak, ['Hello', '--voice', 'bella'])
-        assert result2.exit_code == 0
+        assert run_main('speak', 'Hello', '--voice', 'af_bella') == 0
+        cli_backend.synthesize.assert_called_once_with(
+            "Hello", "af_bella", DEFAULT_SPEED, DEFAULT_PITCH, "kokoro"
+        )
     
-    @patch('vocalize.cli.asyncio.run')
-    @patch('vocalize.cli.validate_voice_id')
-    def test_speak_and_play_integration(self, mock_validate, mock_asyncio):
+    def test_speak_and_play_integration(self, mock_manager_stack, cli_backend, run_main, tmp_path):
         """Test synthesis to file followed by playback."""
-        mock_validate.return_value = "bella"
-        mock_asyncio.return_value = None
+        output_file = tmp_path / "output.wav"
+        cli_backend.save.side_effect = lambda audio_data, output_path, format: Path(output_path).touch()
         
-        # Create temporary output file
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            output_file = tmp.name
+        # Synthesize to file
+        assert run_main('speak', 'Hello world', '--output', str(output_file), '--voice', 'af_bella') == 0
+        assert output_file.exists()
         
-        try:
-            # Synthesize to file
-            result1 = self.runner.invoke(speak, [
-                'Hello world',
-                '--output', output_file,
-                '--voice', 'bella'
-            ])
-            assert result1.exit_code == 0
-            
-            # Play the file (mock the file existence)
-            with patch('pathlib.Path.exists', return_value=True):
-                result2 = self.runner.invoke(play, [output_file])
-                assert result2.exit_code == 0
-        
-        finally:
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+        # Play the file
+        assert run_main('play', str(output_file)) == 0
 
 
 class TestErrorHandlingScenarios:
     """Test comprehensive error handling scenarios."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.runner = CliRunner()
-    
-    def test_speak_invalid_voice(self):
-        """Test speak command with invalid voice."""
-        with patch('vocalize.cli.validate_voice_id') as mock_validate:
-            mock_validate.side_effect = Exception("Voice 'invalid' not found")
-            
-            result = self.runner.invoke(speak, ['Hello', '--voice', 'invalid'])
-            assert result.exit_code == 2  # Click parameter validation error
-    
-    def test_speak_invalid_speed(self):
-        """Test speak command with invalid speed."""
-        with patch('vocalize.cli.validate_speed') as mock_validate:
-            mock_validate.side_effect = Exception("Speed must be between 0.1 and 3.0")
-            
-            result = self.runner.invoke(speak, ['Hello', '--speed', '10.0'])
-            assert result.exit_code == 2
-    
-    def test_speak_invalid_pitch(self):
-        """Test speak command with invalid pitch."""
-        with patch('vocalize.cli.validate_pitch') as mock_validate:
-            mock_validate.side_effect = Exception("Pitch must be between -1.0 and 1.0")
-            
-            result = self.runner.invoke(speak, ['Hello', '--pitch', '5.0'])
-            assert result.exit_code == 2
-    
-    def test_config_set_readonly_file(self):
-        """Test config set with read-only configuration file."""
-        with patch('vocalize.cli.ConfigManager') as mock_config_manager:
-            mock_manager = Mock()
-            mock_manager.set_value.side_effect = Exception("Permission denied")
-            mock_config_manager.return_value = mock_manager
-            
-            result = self.runner.invoke(config, ['set', 'test.key', 'value'])
-            assert result.exit_code == 1
-            assert "Error setting configuration" in result.output
-    
-    def test_unexpected_cli_error(self):
-        """Test handling of unexpected CLI errors."""
-        with patch('vocalize.cli.ConfigManager') as mock_config_manager:
-            mock_config_manager.side_effect = RuntimeError("Unexpected error")
-            
-            result = self.runner.invoke(cli, ['--help'])
-            # Should still work as ConfigManager is only created in context
-            assert result.exit_code == 0
-
-
-if __name__ == '__main__':
-    pytest.main([__file__])
\ No newline at end of file
+    @pytest.mark.parametrize("option,value", [
+        ('--format', 'aiff'),
+        ('--speed', 'fast'),
+        ('--pitch', 'high'),
+    ])
+    def test_speak_invalid_option(self, run_main, option, value):
+        """Test speak command with an unsupported format or a non-numeric speed or pitch."""
+        assert run_main('speak', 'Hello', option, value) == 2
+    
+    def test_models_manager_error(self, monkeypatch, run_main, capsys):
+        """Test models command when the model manager fails."""
+        monkeypatch.setattr(
+            'vocalize.cli.ModelManager', Mock(side_effect=RuntimeError("Unexpected error"))
+        )
+        
+        assert run_main('models', 'list') == 1
+        assert "Error: Unexpected error" in capsys.readouterr().out
+
@@ -1,5 +1,6 @@
 """Tests for TTS engine functionality."""
 
+import array
 import pytest
 import asyncio
 from typing import List
@@ -118,6 +119,22 @@ class TestSynthesisParams:
         assert params.speed == 1.3
         assert params.pitch == 0.2
         assert params.streaming_chunk_size == 256
+        
+    def test_synthesis_params_equality_and_hash(self):
+        """Test equal params compare and hash equal, and differing ones don't."""
+        voice = Voice.default()
+        params = SynthesisParams(voice).with_speed(1.2)
+        same = SynthesisParams(voice).with_speed(1.2)
+        
+        assert params == same
+        assert hash(params) == hash(same)
+        assert len({params, same}) == 1
+        
+        for other in (SynthesisParams(voice).with_speed(1.3),
+                      params.with_pitch(0.1),
+                      params.with_streaming(512)):
+            assert params != other
+            assert len({params, other}) == 2
 
 
 class TestTtsEngine:
@@ -129,96 +146,69 @@ class TestTtsEngine:
         engine = await TtsEngine()
         assert repr(engine) == "TtsEngine()"
         
-    @pytest.mark.asyncio
-    async def test_tts_engine_is_ready(self):
+    def test_tts_engine_is_ready(self, tts_engine):
         """Test TTS engine readiness check."""
-        engine = await TtsEngine()
-        is_ready = await engine.is_ready()
+        is_ready = tts_engine.is_ready()
         assert isinstance(is_ready, bool)
         
-    @pytest.mark.asyncio
-    async def test_synthesize_basic(self):
+    def test_synthesize_basic(self, tts_engine, params):
         """Test basic text synthesis."""
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice)
-        
-        audio_data = await engine.synthesize("Hello, world!", params)
+        audio_data = tts_engine.synthesize_sync("Hello, world!", params)
         
-        assert isinstance(audio_data, list)
+        assert isinstance(audio_data, (list, array.array))
         assert len(audio_data) > 0
         assert all(isinstance(sample, float) for sample in audio_data)
         
-    @pytest.mark.asyncio
-    async def test_synthesize_empty_text(self):
+    def test_synthesize_empty_text(self, tts_engine, params):
         """Test synthesis with empty text."""
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice)
-        
         with pytest.raises(VocalizeError):
-            await engine.synthesize("", params)
+            tts_engine.synthesize_sync("", params)
             
-    @pytest.mark.asyncio
-    async def test_synthesize_long_text(self):
+    def test_synthesize_long_text(self, tts_engine, params):
         """Test synthesis with long text."""
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice)
-        
         long_text = "This is a longer text for testing. " * 10
-        audio_data = await engine.synthesize(long_text, params)
+        audio_data = tts_engine.synthesize_sync(long_text, params)
         
-        assert isinstance(audio_data, list)
+        assert isinstance(audio_data, (list, array.array))
         assert len(audio_data) > 0
         
-    @pytest.mark.asyncio
-    async def test_synthesize_with_speed(self):
+    def test_synthesize_with_speed(self, tts_engine, params):
         """Test synthesis with custom speed."""
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice).with_speed(1.5)
+        params = params.with_speed(1.5)
         
-        audio_data = await engine.synthesize("Hello, world!", params)
+        audio_data = tts_engine.synthesize_sync("Hello, world!", params)
         
-        assert isinstance(audio_data, list)
+        assert isinstance(audio_data, (list, array.array))
         assert len(audio_data) > 0
         
-    @pytest.mark.asyncio
-    async def test_synthesize_with_pitch(self):
+    def test_synthesize_with_pitch(self, tts_engine, params):
         """Test synthesis with custom pitch."""
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice).with_pitch(0.2)
+        params = params.with_pitch(0.2)
         
-        audio_data = await engine.synthesize("Hello, world!", params)
+        audio_data = tts_engine.synthesize_sync("Hello, world!", params)
         
-        assert isinstance(audio_data, list)
+        assert isinstance(audio_data, (list, array.array))
         assert len(audio_data) > 0
         
-    @pytest.mark.asyncio
-    async def test_synthesize_different_voices(self):
+    def test_synthesize_different_voices(self, tts_engine):
         """Test synthesis with different voices."""
-        engine = await TtsEngine()
         voice_manager = VoiceManager()
         voices = voice_manager.get_available_voices()
         
         # Test with at least 2 different voices
         for voice in voices[:2]:
             params = SynthesisParams(voice)
-            audio_data = await engine.synthesize("Hello", params)
+            audio_data = tts_engine.synthesize_sync("Hello", params)
             
-            assert isinstance(audio_data, list)
+            assert isinstance(audio_data, (list, array.array))
             assert len(audio_data) > 0
             
     @pytest.mark.asyncio
-    async def test_synthesize_streaming(self):
+    async def test_synthesize_streaming(self, tts_engine, params):
         """Test streaming synthesis."""
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice).with_streaming(1024)
+        params = params.with_streaming(1024)
         
-        chunks = await engine.synthesize_streaming("This is a test for streaming synthesis.", params)
+        chunks = await tts_engine.synthesize_streaming("This is a test for streaming synthesis.", params)
         
         assert isinstance(chunks, list)
         assert len(chunks) > 0
@@ -226,13 +216,9 @@ class TestTtsEngine:
         assert all(len(chunk) > 0 for chunk in chunks)
         
     @pytest.mark.asyncio
-    async def test_synthesize_streaming_no_streaming(self):
+    async def test_synthesize_streaming_no_streaming(self, tts_engine, params):
         """Test streaming synthesis without streaming enabled."""
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice)  # No streaming
-        
-        chunks = await engine.synthesize_streaming("Hello", params)
+        chunks = await tts_engine.synthesize_streaming("Hello", params)
         
         # Should return single chunk
         assert isinstance(chunks, list)
@@ -240,14 +226,13 @@ class TestTtsEngine:
         assert isinstance(chunks[0], list)
         
     @pytest.mark.asyncio
-    async def test_preload_models(self):
+    async def test_preload_models(self, tts_engine):
         """Test model preloading."""
-        engine = await TtsEngine()
         voice_manager = VoiceManager()
         voice_ids = [v.id for v in voice_manager.get_available_voices()[:2]]
         
         # Should not raise an error
-        await engine.preload_models(voice_ids)
+        await tts_engine.preload_models(voice_ids)
         
     @pytest.mark.asyncio
     async def test_clear_cache(self):
@@ -285,48 +270,37 @@ class TestTtsEngine:
 class TestTtsEngineEdgeCases:
     """Test TTS engine edge cases and error conditions."""
     
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    async def test_synthesize_very_long_text(self):
+    async def test_synthesize_very_long_text(self, tts_engine, params):
         """Test synthesis with very long text."""
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice)
-        
         # Text approaching the limit
         long_text = "A" * 50000  # 50k characters
         
         try:
-            audio_data = await engine.synthesize(long_text, params)
-            assert isinstance(audio_data, list)
+            audio_data = await tts_engine.synthesize(long_text, params)
+            assert isinstance(audio_data, (list, array.array))
             assert len(audio_data) > 0
         except VocalizeError:
             # This is acceptable - the engine may reject very long text
             pass
             
     @pytest.mark.asyncio
-    async def test_synthesize_special_characters(self):
+    async def test_synthesize_special_characters(self, tts_engine, params):
         """Test synthesis with special characters."""
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice)
-        
         special_text = "Hello! How are you? I'm fine. 123 + 456 = 579."
-        audio_data = await engine.synthesize(special_text, params)
+        audio_data = await tts_engine.synthesize(special_text, params)
         
-        assert isinstance(audio_data, list)
+        assert isinstance(audio_data, (list, array.array))
         assert len(audio_data) > 0
         
     @pytest.mark.asyncio
-    async def test_synthesize_unicode_text(self):
+    async def test_synthesize_unicode_text(self, tts_engine, params):
         """Test synthesis with unicode text."""
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice)
-        
         unicode_text = "Hello world! 🌍 Nice day ☀️"
-        audio_data = await engine.synthesize(unicode_text, params)
+        audio_data = await tts_engine.synthesize(unicode_text, params)
         
-        assert isinstance(audio_data, list)
+        assert isinstance(audio_data, (list, array.array))
         assert len(audio_data) > 0
         
     @pytest.mark.asyncio
@@ -342,8 +316,8 @@ class TestTtsEngineEdgeCases:
         audio1 = await engine1.synthesize("Hello from engine 1", params)
         audio2 = await engine2.synthesize("Hello from engine 2", params)
         
-        assert isinstance(audio1, list)
-        assert isinstance(audio2, list)
+        assert isinstance(audio1, (list, array.array))
+        assert isinstance(audio2, (list, array.array))
         assert len(audio1) > 0
         assert len(audio2) > 0
 
@@ -352,16 +326,12 @@ class TestTtsEnginePerformance:
     """Test TTS engine performance characteristics."""
     
     @pytest.mark.asyncio
-    async def test_synthesis_timing(self):
+    async def test_synthesis_timing(self, tts_engine, params):
         """Test that synthesis completes in reasonable time."""
         import time
         
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice)
-        
         start_time = time.time()
-        audio_data = await engine.synthesize("Hello, world!", params)
+        audio_data = await tts_engine.synthesize("Hello, world!", params)
         end_time = time.time()
         
         synthesis_time = end_time - start_time
@@ -371,15 +341,11 @@ class TestTtsEnginePerformance:
         assert len(audio_data) > 0
         
     @pytest.mark.asyncio
-    async def test_concurrent_synthesis(self):
+    async def test_concurrent_synthesis(self, tts_engine, params):
         """Test concurrent synthesis requests."""
-        engine = await TtsEngine()
-        voice = Voice.default()
-        params = SynthesisParams(voice)
-        
         # Run multiple synthesis requests concurrently
         tasks = [
-            engine.synthesize(f"Hello number {i}", params)
+            tts_engine.synthesize(f"Hello number {i}", params)
             for i in range(3)
         ]
         
@@ -387,9 +353,5 @@ class TestTtsEnginePerformance:
         
         assert len(results) == 3
         for audio_data in results:
-            assert isinstance(audio_data, list)
+            assert isinstance(audio_data, (list, array.array))
             assert len(audio_data) > 0
-
-
-if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""Tests for the Python voice manager."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from vocalize.voice_manager import VOICE_CACHE_VERSION, VoiceManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Voice manager rooted at an empty cache directory."""
+    return VoiceManager(str(tmp_path))
+
+
+@pytest.fixture
+def voices_npz(tmp_path):
+    """Kokoro voices archive in the location the slow path looks for."""
+    npz_dir = tmp_path / "models--direct_download" / "local"
+    npz_dir.mkdir(parents=True)
+    npz_path = npz_dir / "voices-v1.0.bin"
+    with open(npz_path, "wb") as f:
+        np.savez(f, af_bella=np.zeros(4), jf_alpha=np.zeros(4), zm_yunxi=np.zeros(4))
+    return npz_path
+
+
+class TestVoiceMetadata:
+    """Test gender/language parsing from voice IDs."""
+    
+    @pytest.mark.parametrize("voice_id,gender,language", [
+        ("af_bella", "female", "english"),
+        ("af_alloy", "male", "english"),
+        ("jf_alpha", "female", "japanese"),
+        ("zm_yunxi", "male", "chinese"),
+        ("ef_dora", "female", "spanish"),
+        ("en_female_1", "female", "english"),
+    ])
+    def test_parse_meta(self, manager, voice_id, gender, language):
+        """Test prefix table, overrides and the substring fallback."""
+        assert manager._parse_meta(voice_id) == (gender, language)
+
+
+class TestVoiceAliases:
+    """Test alias resolution and the reverse alias lookup."""
+    
+    def test_resolve_alias(self, manager):
+        """Test aliases resolve case-insensitively and IDs pass through."""
+        assert manager.resolve_voice_alias("Bella") == "af_bella"
+        assert manager.resolve_voice_alias("af_bella") == "af_bella"
+        assert manager.resolve_voice_alias("unknown") == "unknown"
+    
+    def test_get_voice_aliases(self, manager):
+        """Test every alias pointing at a voice is returned."""
+        assert set(manager.get_voice_aliases("af_nova")) == {"nova", "female"}
+        assert manager.get_voice_aliases("af_aoede") == ()
+
+
+class TestVoiceCache:
+    """Test building and reading voice_cache.json."""
+    
+    def test_cache_built_from_npz(self, manager, voices_npz):
+        """Test the slow path writes a versioned cache with parsed metadata."""
+        voices = {v.id: v for v in manager.discover_voices("kokoro")}
+        
+        assert sorted(voices) == ["af_bella", "jf_alpha", "zm_yunxi"]
+        assert (voices["jf_alpha"].gender, voices["jf_alpha"].language) == ("female", "japanese")
+        
+        cache = json.loads(manager.voice_cache_file.read_text())
+        assert cache["version"] == VOICE_CACHE_VERSION
+    
+    def test_unversioned_cache_rebuilt(self, manager, voices_npz):
+        """Test a cache from an older release is rebuilt, not served."""
+        stale = {"kokoro": {"voices": [{
+            "id": "jf_alpha", "name": "Jf Alpha", "gender": "neutral",
+            "language": "english", "file_path": str(voices_npz),
+        }], "last_updated": "0"}}
+        manager.voice_cache_file.write_text(json.dumps(stale))
+        
+        voices = {v.id: v for v in manager.discover_voices("kokoro")}
+        
+        assert voices["jf_alpha"].language == "japanese"
+        assert len(voices) == 3
+    
+    def test_cache_rebuilt_when_npz_changes(self, manager, voices_npz):
+        """Test replacing the voices NPZ invalidates the cached voice list."""
+        manager.discover_voices("kokoro")
+        
+        with open(voices_npz, "wb") as f:
+            np.savez(f, af_bella=np.zeros(4), am_adam=np.zeros(4), bf_emma=np.zeros(4), bm_george=np.zeros(4))
+        
+        voices = [v.id for v in manager.discover_voices("kokoro")]
+        
+        assert voices == ["af_bella", "am_adam", "bf_emma", "bm_george"]
+    
+    def test_cached_data_is_read_only(self, manager, voices_npz):
+        """Test callers can't mutate the cache shared between calls."""
+        manager.discover_voices("kokoro")
+        cache = manager._load_voice_cache()
+        
+        assert cache is manager._load_voice_cache()
+        with pytest.raises(TypeError):
+            cache["kokoro"] = {}
+    
+    def test_rewrite_replaces_in_memory_cache(self, manager, voices_npz):
+        """Test a rebuild is served even if the file mtime didn't move."""
+        manager.discover_voices("kokoro")
+        old_mtime = manager.voice_cache_file.stat().st_mtime_ns
+        
+        with open(voices_npz, "wb") as f:
+            np.savez(f, am_adam=np.zeros(4))
+        manager._create_voice_cache_from_npz("kokoro", voices_npz)
+        os.utime(manager.voice_cache_file, ns=(old_mtime, old_mtime))
+        
+        cache = manager._load_voice_cache()
+        assert [v["id"] for v in cache["kokoro"]["voices"]] == ["am_adam"]
@@ -7,13 +7,16 @@ Each model has its own set of compatible voices that are downloaded as complete
 
 import os
 import json
-import math
+import mmap
+import sys
+import zipfile
 from pathlib import Path
-from typing import List, Dict, Optional
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
-# Voice alias mapping for user-friendly names
-VOICE_ALIASES = {
+# Voice alias mapping for user-friendly names (read-only, safe to share across threads)
+VOICE_ALIASES = MappingProxyType({
     # User-friendly names → Kokoro voice IDs
     "bella": "af_bella",
     "alloy": "af_alloy", 
@@ -35,12 +38,81 @@ VOICE_ALIASES = {
     # Additional common aliases
     "female": "af_nova",
     "male": "am_adam",
+})
+
+# Reverse of VOICE_ALIASES: Kokoro voice ID → the aliases that point at it
+_CANONICAL_TO_ALIASES: Dict[str, Tuple[str, ...]] = {}
+for _alias, _voice_id in VOICE_ALIASES.items():
+    _CANONICAL_TO_ALIASES[_voice_id] = _CANONICAL_TO_ALIASES.get(_voice_id, ()) + (_alias,)
+del _alias, _voice_id
+
+# Kokoro voice ID prefixes (language + gender), checked via voice_id[:3]
+_VOICE_PREFIXES = frozenset({
+    "af_", "am_", "bf_", "bm_", "ef_", "em_", "ff_", "hf_", "hm_",
+    "if_", "im_", "jf_", "jm_", "pf_", "pm_", "zf_", "zm_",
+})
+
+# Bump whenever the shape or derived contents of voice_cache.json change, so
+# caches written by older releases are rebuilt instead of served as-is
+VOICE_CACHE_VERSION = 2
+
+# (gender, language) for each Kokoro voice ID prefix
+_VOICE_META = {
+    "af_": ("female", "english"), "am_": ("male", "english"),
+    "bf_": ("female", "english"), "bm_": ("male", "english"),
+    "ef_": ("female", "spanish"), "em_": ("male", "spanish"),
+    "ff_": ("female", "french"),
+    "hf_": ("female", "hindi"), "hm_": ("male", "hindi"),
+    "if_": ("female", "italian"), "im_": ("male", "italian"),
+    "jf_": ("female", "japanese"), "jm_": ("male", "japanese"),
+    "pf_": ("female", "portuguese"), "pm_": ("male", "portuguese"),
+    "zf_": ("female", "chinese"), "zm_": ("male", "chinese"),
+}
+
+# Voices whose metadata doesn't follow their prefix
+_VOICE_META_OVERRIDES = {
+    "af_alloy": ("male", "english"),
+}
+
+# Human-readable names for the common Kokoro voices, built once at import
+_VOICE_NAMES = {
+    'af_alloy': 'Alloy (Male)',
+    'af_bella': 'Bella (Female)',
+    'af_nova': 'Nova (Female)',
+    'af_aoede': 'Aoede (Female)',
+    'af_heart': 'Heart (Female)',
+    'af_jessica': 'Jessica (Female)',
+    'af_kore': 'Kore (Female)',
+    'af_nicole': 'Nicole (Female)',
+    'af_river': 'River (Female)',
+    'af_sarah': 'Sarah (Female)',
+    'af_sky': 'Sky (Female)',
+    'am_adam': 'Adam (Male)',
+    'am_echo': 'Echo (Male)',
+    'am_eric': 'Eric (Male)',
+    'am_fenrir': 'Fenrir (Male)',
+    'am_liam': 'Liam (Male)',
+    'am_michael': 'Michael (Male)',
+    'am_onyx': 'Onyx (Male)',
+    'am_puck': 'Puck (Male)',
 }
 
-try:
-    import tinynumpy as np  # Lightweight alternative to numpy for faster imports
-except ImportError:
-    import numpy as np  # Fallback to regular numpy
+def _read_npz_voice_ids(npz_path: Path) -> List[str]:
+    """List voice IDs in a voices NPZ from its ZIP directory, without numpy."""
+    with zipfile.ZipFile(npz_path) as zf:
+        return sorted(name[:-len(".npy")] for name in zf.namelist() if name.endswith(".npy"))
+
+def _freeze(value):
+    """Recursively turn parsed JSON into read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _npz_fingerprint(st: os.stat_result) -> str:
+    """Cheap change marker for the voices NPZ, from its size and mtime."""
+    return f"{st.st_size}:{st.st_mtime}"
 
 @dataclass
 class VoiceInfo:
@@ -57,31 +129,38 @@ class VoiceManager:
     def __init__(self, cache_dir: str):
         self.cache_dir = Path(cache_dir)
         self.voice_cache_file = self.cache_dir / "voice_cache.json"
+        # Parsed voice cache (read-only) and the file mtime it was read at
+        self._cache: Optional[Mapping] = None
+        self._cache_mtime = 0.0
     
     def validate_style_vector(self, style_vector: List[float]) -> bool:
         """Validate style vector to prevent neural network instability."""
-        if not style_vector or len(style_vector) != 256:
+        if style_vector is None or len(style_vector) != 256:
             return False
         
+        import numpy as np
+        values = np.asarray(style_vector, dtype=np.float32)
+        
         # Check for NaN/Inf values (causes immediate model corruption)
-        if any(not math.isfinite(x) for x in style_vector):
+        if not np.isfinite(values).all():
             print("⚠️ Style vector contains NaN/Inf values")
             return False
         
         # Check for extreme values (causes gradient explosion)
-        if any(abs(x) > 10.0 for x in style_vector):
+        max_abs = float(np.abs(values).max())
+        if max_abs > 10.0:
             print("⚠️ Style vector contains extreme values")
             return False
         
         # Check for all zeros (indicates failed loading)
-        if all(abs(x) < 0.001 for x in style_vector):
+        if max_abs < 0.001:
             print("⚠️ Style vector appears to be all zeros")
             return False
         
         # Check for uniform random values (indicates fallback to random)
-        mean_val = sum(style_vector) / len(style_vector)
+        mean_val = float(values.mean())
         if abs(mean_val) < 0.01:  # Random [-1,1] should have mean ~0
-            variance = sum((x - mean_val) ** 2 for x in style_vector) / len(style_vector)
+            variance = float(values.var())
             if variance > 0.8:  # High variance suggests random values
                 print("⚠️ Style vector appears to be random values")
                 return False
@@ -91,7 +170,7 @@ class VoiceManager:
     def resolve_voice_alias(self, voice_id: str) -> str:
         """Resolve user-friendly voice names to actual Kokoro voice IDs."""
         # Try exact match first
-        if voice_id.startswith(('af_', 'am_', 'bf_', 'bm_', 'ef_', 'em_', 'ff_', 'hf_', 'hm_', 'if_', 'im_', 'jf_', 'jm_', 'pf_', 'pm_', 'zf_', 'zm_')):
+        if voice_id[:3] in _VOICE_PREFIXES:
             return voice_id
         
         # Try alias mapping
@@ -103,59 +182,91 @@ class VoiceManager:
         # Return original if no alias found
         return voice_id
     
-    def _load_voice_cache(self) -> Dict:
-        """Load voice cache from JSON file for fast access."""
-        if self.voice_cache_file.exists():
-            try:
-                with open(self.voice_cache_file, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                pass
-        return {}
+    def get_voice_aliases(self, voice_id: str) -> Tuple[str, ...]:
+        """Return the user-friendly aliases that resolve to a Kokoro voice ID."""
+        return _CANONICAL_TO_ALIASES.get(voice_id, ())
     
-    def _create_voice_cache_from_npz(self, model_id: str, npz_path: Path) -> Dict:
+    def _load_voice_cache(self) -> Mapping:
+        """Load voice cache from JSON file, reusing the parsed copy until the file changes.
+        
+        The result is shared between calls, so it is returned as a read-only view.
+        """
+        try:
+            mtime = self.voice_cache_file.stat().st_mtime
+        except OSError:
+            return {}
+        
+        if self._cache is not None and mtime == self._cache_mtime:
+            return self._cache
+        
+        try:
+            with open(self.voice_cache_file, 'r') as f:
+                cache = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return {}
+        
+        # Written by an older release: treat as missing so it gets rebuilt
+        if cache.get("version") != VOICE_CACHE_VERSION:
+            return {}
+        
+        self._cache = _freeze(cache)
+        self._cache_mtime = mtime
+        return self._cache
+    
+    def _create_voice_cache_from_npz(self, model_id: str, npz_path: Path) -> Mapping:
         """Create voice cache from NPZ file (slow operation)."""
         print(f"🔄 Creating voice cache from NPZ file...")
-        # NPZ loading requires full numpy, not tinynumpy
-        import numpy as np_full
-        voices_data = np_full.load(str(npz_path))
+        st = npz_path.stat()
+        voice_ids = _read_npz_voice_ids(npz_path)
         
         cache_data = {
+            "version": VOICE_CACHE_VERSION,
             "kokoro": {
                 "voices": [],
-                "last_updated": str(npz_path.stat().st_mtime)
+                "last_updated": str(st.st_mtime),
+                "fingerprint": _npz_fingerprint(st)
             }
         }
         
-        for voice_id in sorted(voices_data.files):
+        for voice_id in voice_ids:
+            gender, language = self._parse_meta(voice_id)
             cache_data["kokoro"]["voices"].append({
                 "id": voice_id,
                 "name": self._parse_voice_name(voice_id),
-                "gender": self._parse_gender(voice_id),
-                "language": self._parse_language(voice_id),
+                "gender": gender,
+                "language": language,
                 "file_path": str(npz_path)
             })
         
         # Save cache to file
         self.voice_cache_file.parent.mkdir(parents=True, exist_ok=True)
         with open(self.voice_cache_file, 'w') as f:
-            json.dump(cache_data, f, indent=2)
+            # Compact separators; the file is machine-read and whitespace only slows parsing
+            json.dump(cache_data, f, separators=(',', ':'))
+        
+        # Adopt what we just wrote; a rewrite within the same mtime tick would
+        # otherwise keep serving the previous contents
+        self._cache = _freeze(cache_data)
+        self._cache_mtime = self.voice_cache_file.stat().st_mtime
         
         print(f"✅ Voice cache created with {len(cache_data['kokoro']['voices'])} voices")
-        return cache_data
+        return self._cache
     
     def _discover_voices_from_cache(self, model_id: str) -> List[VoiceInfo]:
         """Fast voice discovery using cached data."""
-        cache = self._load_voice_cache()
-        
+        return self._voices_from_cache_data(self._load_voice_cache(), model_id)
+    
+    def _voices_from_cache_data(self, cache: Mapping, model_id: str) -> List[VoiceInfo]:
+        """Build VoiceInfo objects from already-parsed voice cache data."""
         if model_id in cache:
             voices = []
             for voice_data in cache[model_id]["voices"]:
                 voices.append(VoiceInfo(
                     id=voice_data["id"],
                     name=voice_data["name"],
-                    gender=voice_data["gender"],
-                    language=voice_data["language"],
+                    # Only a handful of distinct values, so share one string each
+                    gender=sys.intern(voice_data["gender"]),
+                    language=sys.intern(voice_data["language"]),
                     file_path=voice_data["file_path"]
                 ))
             print(f"✅ Discovered {len(voices)} {model_id} voices from cache")
@@ -166,10 +277,11 @@ class VoiceManager:
     def discover_voices(self, model_id: str) -> List[VoiceInfo]:
         """Discover all voices for a model - fast cache first, then NPZ if needed."""
         
-        # Try fast cache lookup first
-        voices = self._discover_voices_from_cache(model_id)
-        if voices:
-            return voices
+        # Try fast cache lookup first, unless the Kokoro NPZ changed since it was built
+        if model_id != "kokoro" or self._kokoro_cache_is_current():
+            voices = self._discover_voices_from_cache(model_id)
+            if voices:
+                return voices
         
         # Fallback to slow NPZ loading and cache creation
         if model_id == "kokoro":
@@ -178,17 +290,29 @@ class VoiceManager:
         # For other models, use the original file-based discovery
         return self._discover_voices_from_files(model_id)
     
+    def _kokoro_npz_path(self) -> Path:
+        """Location of the Kokoro voices NPZ the cache is built from."""
+        return self.cache_dir / "models--direct_download" / "local" / "voices-v1.0.bin"
+    
+    def _kokoro_cache_is_current(self) -> bool:
+        """Check the cached Kokoro voices were built from the NPZ now on disk."""
+        try:
+            st = self._kokoro_npz_path().stat()
+        except OSError:
+            # Nothing to rebuild from; serve whatever the cache has
+            return True
+        kokoro = self._load_voice_cache().get("kokoro", {})
+        return kokoro.get("fingerprint") == _npz_fingerprint(st)
+    
     def _discover_kokoro_voices_slow(self) -> List[VoiceInfo]:
         """Slow path: Load Kokoro voices from NPZ and create cache."""
-        # Look for Kokoro NPZ file
-        model_cache = self.cache_dir / "models--direct_download" / "local"
-        npz_path = model_cache / "voices-v1.0.bin"
+        npz_path = self._kokoro_npz_path()
         
         if npz_path.exists():
             # Create cache from NPZ file
             cache_data = self._create_voice_cache_from_npz("kokoro", npz_path)
-            # Return voices from the cache we just created
-            return self._discover_voices_from_cache("kokoro")
+            # Use the cache we just built rather than re-reading and re-parsing the file
+            return self._voices_from_cache_data(cache_data, "kokoro")
         
         return []
     
@@ -196,59 +320,79 @@ class VoiceManager:
         """Original file-based voice discovery for non-Kokoro models."""
         voices = []
         
-        # Calculate model cache directory based on model_id
-        model_cache = self.cache_dir / f"models--{model_id.replace('/', '--')}"
+        # Calculate model cache directory based on model_id (plain strings, so
+        # the scan below never builds Path objects)
+        model_cache = os.path.join(self.cache_dir, f"models--{model_id.replace('/', '--')}")
         
         voices_dirs = [
-            model_cache / "local" / "voices",
-            model_cache / "local",
+            os.path.join(model_cache, "local", "voices"),
+            os.path.join(model_cache, "local"),
         ]
         
         # Also check in snapshots directory
-        snapshots_dir = model_cache / "snapshots"
-        if snapshots_dir.exists():
-            for snapshot in snapshots_dir.iterdir():
-                if snapshot.is_dir():
-                    voices_dirs.extend([
-                        snapshot / "voices",
-                        snapshot,
-                    ])
+        try:
+            with os.scandir(os.path.join(model_cache, "snapshots")) as snapshots:
+                for snapshot in snapshots:
+                    if snapshot.is_dir():
+                        voices_dirs.extend([
+                            os.path.join(snapshot.path, "voices"),
+                            snapshot.path,
+                        ])
+        except (FileNotFoundError, NotADirectoryError):
+            pass
         
         voice_files_found = set()
         
         for voices_dir in voices_dirs:
-            if not voices_dir.exists():
+            try:
+                # scandir hands back cached DirEntry info, avoiding a stat per file
+                with os.scandir(voices_dir) as entries:
+                    for entry in entries:
+                        # Avoid duplicates
+                        if not entry.name.endswith(".bin") or entry.name in voice_files_found:
+                            continue
+                        if not entry.is_file():
+                            continue
+                        voice_files_found.add(entry.name)
+                        
+                        # Extract voice info from filename
+                        voice_id = entry.name[:-len(".bin")]
+                        gender, language = self._parse_meta(voice_id)
+                        voices.append(VoiceInfo(
+                            id=voice_id,
+                            name=self._parse_voice_name(voice_id),
+                            gender=gender,
+                            language=language,
+                            file_path=entry.path
+                        ))
+            except (FileNotFoundError, NotADirectoryError):
                 continue
-                
-            for voice_file in voices_dir.glob("*.bin"):
-                # Avoid duplicates
-                if voice_file.name in voice_files_found:
-                    continue
-                voice_files_found.add(voice_file.name)
-                
-                # Extract voice info from filename
-                voice_id = voice_file.stem
-                voices.append(VoiceInfo(
-                    id=voice_id,
-                    name=self._parse_voice_name(voice_id),
-                    gender=self._parse_gender(voice_id),
-                    language=self._parse_language(voice_id),
-                    file_path=str(voice_file)
-                ))
         
         return voices
     
-    def load_voice_embedding(self, voice_file: str) -> List[float]:
-        """Load voice embedding from binary file"""
+    def load_voice_embedding(self, voice_file: str) -> Sequence[float]:
+        """Load voice embedding from binary file as a float32 array.
+        
+        The file is memory-mapped and copied into the array in one pass rather
+        than into a list of Python floats; the mapping is closed on return.
+        """
         if not os.path.exists(voice_file):
             raise FileNotFoundError(f"Voice file not found: {voice_file}")
         
+        # Imported here so listing or resolving voices never pays the numpy import cost
+        import numpy as np
+        
         try:
-            # Load binary voice embedding
-            voice_data = np.fromfile(voice_file, dtype=np.float32)
-            if len(voice_data) == 0:
+            # mmap refuses zero-length files, so check for emptiness first
+            if os.path.getsize(voice_file) == 0:
                 raise ValueError("Voice embedding file is empty")
-            return voice_data.tolist()
+            with open(voice_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = np.frombuffer(mapped, dtype=np.float32)
+                embedding = view.copy()
+                # Drop the exported view, or closing the mapping raises BufferError
+                del view
+            return embedding
         except Exception as e:
             raise RuntimeError(f"Failed to load voice embedding: {e}")
     
@@ -267,34 +411,18 @@ class VoiceManager:
     
     def _parse_voice_name(self, voice_id: str) -> str:
         """Parse human-readable voice name from ID"""
-        # Handle common voice ID patterns
-        name_mappings = {
-            'af_alloy': 'Alloy (Male)',
-            'af_bella': 'Bella (Female)', 
-            'af_nova': 'Nova (Female)',
-            'af_aoede': 'Aoede (Female)',
-            'af_heart': 'Heart (Female)',
-            'af_jessica': 'Jessica (Female)',
-            'af_kore': 'Kore (Female)',
-            'af_nicole': 'Nicole (Female)',
-            'af_river': 'River (Female)',
-            'af_sarah': 'Sarah (Female)',
-            'af_sky': 'Sky (Female)',
-            'am_adam': 'Adam (Male)',
-            'am_echo': 'Echo (Male)',
-            'am_eric': 'Eric (Male)',
-            'am_fenrir': 'Fenrir (Male)',
-            'am_liam': 'Liam (Male)',
-            'am_michael': 'Michael (Male)',
-            'am_onyx': 'Onyx (Male)',
-            'am_puck': 'Puck (Male)',
-        }
-        
-        if voice_id in name_mappings:
-            return name_mappings[voice_id]
+        # Known voices first, generic parsing otherwise
+        return _VOICE_NAMES.get(voice_id) or voice_id.replace('_', ' ').title()
+    
+    def _parse_meta(self, voice_id: str) -> Tuple[str, str]:
+        """Parse (gender, language) from voice ID with one table lookup"""
+        voice_lower = voice_id.lower()
+        meta = _VOICE_META_OVERRIDES.get(voice_lower) or _VOICE_META.get(voice_lower[:3])
+        if meta:
+            return meta
         
-        # Generic parsing
-        return voice_id.replace('_', ' ').title()
+        # IDs without a Kokoro prefix fall back to the substring heuristics
+        return self._parse_gender(voice_id), self._parse_language(voice_id)
     
     def _parse_gender(self, voice_id: str) -> str:
         """Parse gender from voice ID"""
@@ -347,16 +475,13 @@ class VoiceManager:
             return voices
         
         try:
-            # Load voices from NPZ file - requires full numpy
-            import numpy as np_full
-            voices_data = np_full.load(str(voices_file))
-            
-            for voice_id in sorted(voices_data.files):
+            for voice_id in _read_npz_voice_ids(voices_file):
+                gender, language = self._parse_meta(voice_id)
                 voices.append(VoiceInfo(
                     id=voice_id,
                     name=self._parse_voice_name(voice_id),
-                    gender=self._parse_gender(voice_id),
-                    language=self._parse_language(voice_id),
+                    gender=gender,
+                    language=language,
                     file_path=str(voices_file)  # Point to the NPZ file
                 ))
             